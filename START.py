@@ -4,38 +4,49 @@ ULTIMATE SIMPLE START - Just run this file
 """
 print("🚀 Starting AeroCast with Model Support...")
 
-try:
-    import uvicorn
-    print("✅ uvicorn found")
-except ImportError:
-    print("❌ Installing uvicorn...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "uvicorn", "fastapi"])
+import importlib
+import os
+import subprocess
+import sys
 
-try:
-    from fastapi import FastAPI
-    print("✅ FastAPI found")
-except ImportError:
-    print("❌ Installing FastAPI...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "fastapi"])
+# Installing on a cold start costs a full pip resolve, so it is opt-in
+AUTOINSTALL = bool(os.getenv("AEROCAST_AUTOINSTALL"))
+
+for module, label, packages in [
+    ("uvicorn", "uvicorn", ["uvicorn", "fastapi"]),
+    ("fastapi", "FastAPI", ["fastapi"]),
+    ("numpy", "NumPy", ["numpy"]),
+]:
+    try:
+        importlib.import_module(module)
+        print(f"✅ {label} found")
+    except ImportError:
+        if not AUTOINSTALL:
+            print(f"❌ {label} not installed. Run: pip install -r requirements.txt")
+            print("   (or set AEROCAST_AUTOINSTALL=1 to install missing packages automatically)")
+            sys.exit(1)
+        print(f"❌ Installing {label}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
 
 try:
-    import numpy as np
-    print("✅ NumPy found")
+    import uvloop
+    loop = "uvloop"
+    print("✅ uvloop found")
 except ImportError:
-    print("❌ Installing NumPy...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "numpy"])
+    loop = "asyncio"
+    print("⚠️ uvloop not available, using asyncio event loop")
 
 # Now start the server
-import os
 from pathlib import Path
 
 os.chdir(Path(__file__).parent)
+sys.path.insert(0, str(Path(__file__).parent))
 
 print("📍 Server will be at: http://localhost:8000")
 print("🧠 Model API will be at: http://localhost:8000/api/v1/")
 print("⚡ Starting with full model support...")
 
-os.system("python minimal_start.py")
\ No newline at end of file
+import uvicorn
+from minimal_start import app
+
+uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop)
\ No newline at end of file
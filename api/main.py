@@ -1,13 +1,14 @@
 """
 FastAPI application for air quality forecasting
 """
-from fastapi import FastAPI, HTTPException, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 import uvicorn
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
 import sys
 from pathlib import Path
 
@@ -16,61 +17,86 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from config.settings import settings
 from api.routes import forecast, health
+from api.middleware.cors import FastCORS
+from api.static import StaticCache, StaticJSON
 from src.utils.logger import setup_logging, get_logger
 
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application on startup and clean up on shutdown"""
+    logger.info(f"Starting {settings.APP_NAME} v{settings.VERSION}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+    
+    # Load the model and exercise NumPy before the first request arrives
+    if settings.WARMUP_MODEL:
+        forecast._get_model_service().warmup()
+    
+    cpu_sampler = asyncio.create_task(health.cpu_sampler())
+    yield
+    
+    logger.info("Shutting down application")
+    cpu_sampler.cancel()
+
 # Create FastAPI app
 app = FastAPI(
     title="AeroCast API - Air Quality Forecasting",
     version="1.0.0",
     description="Advanced AI/ML-based air quality forecasting platform for Delhi NCR",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "https://aerocast-air-quality-forecasting.vercel.app",  # Your Vercel URL
-        "https://aerocast-sarthak0105.vercel.app",  # Alternative Vercel URL format
-        "http://localhost:3000",  # Keep for local development
-        "http://localhost:3001"   # Keep for local development
-    ],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    FastCORS,
+    origins=settings.CORS_ORIGINS,
+    methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    headers=["*"],
 )
 
-# Mount static files (fallback for old HTML version)
-if Path("static").exists():
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+# Compress large JSON payloads (48h forecasts); health responses stay under the threshold.
+# Responses that already carry a Content-Encoding (precompressed static files) pass through.
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Absolute paths so the app does not depend on the working directory
+STATIC_DIR = settings.BASE_DIR.resolve() / "static"
+FRONTEND_DIR = settings.BASE_DIR.resolve() / "frontend"
+
+# Serve static files from memory (fallback for old HTML version)
+static_cache = StaticCache(STATIC_DIR)
+app.mount("/static", static_cache, name="static")
+
+# Resolve the React entry page once; the deployed layout does not change at runtime
+REACT_INDEX: Optional[Path] = FRONTEND_DIR / ".next" / "server" / "pages" / "index.html"
+if not REACT_INDEX.exists():
+    REACT_INDEX = None
 
 # Mount React build files if available
-if Path("frontend/.next").exists():
-    app.mount("/_next", StaticFiles(directory="frontend/.next"), name="next_static")
-if Path("frontend/public").exists():
-    app.mount("/public", StaticFiles(directory="frontend/public"), name="public")
+if (FRONTEND_DIR / ".next").exists():
+    app.mount("/_next", StaticFiles(directory=FRONTEND_DIR / ".next"), name="next_static")
+if (FRONTEND_DIR / "public").exists():
+    app.mount("/public", StaticFiles(directory=FRONTEND_DIR / "public"), name="public")
 
 # Include routers
+app.mount("/health", health.HealthASGI(health.router))
+# Same routes again for /openapi.json; the mount above matches first and serves them
 app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(forecast.router, prefix="/api/v1", tags=["forecast"])
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup"""
-    from config.settings import settings
-    logger.info(f"Starting {settings.APP_NAME} v{settings.VERSION}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    logger.info("Shutting down application")
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
@@ -81,62 +107,60 @@ async def global_exception_handler(request, exc):
     )
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint - serve main dashboard"""
-    from fastapi.responses import FileResponse
-    
     # Try to serve React build first
-    react_index = Path("frontend/.next/server/pages/index.html")
-    if react_index.exists():
-        return FileResponse(str(react_index))
+    if REACT_INDEX is not None:
+        return FileResponse(REACT_INDEX)
     
     # Fallback to static HTML
-    static_index = Path("static/index.html")
-    if static_index.exists():
-        return FileResponse(str(static_index))
+    if "index.html" in static_cache.files:
+        return static_cache.response("index.html", request)
     
     # If neither exists, return a simple message
     return {"message": "Delhi Air Quality Forecasting API", "frontend": "not_found"}
 
 @app.get("/historical")
-async def historical():
+async def historical(request: Request):
     """Historical data page"""
-    from fastapi.responses import FileResponse
-    return FileResponse("static/historical.html")
+    return static_cache.response("historical.html", request)
 
 @app.get("/analytics") 
-async def analytics():
+async def analytics(request: Request):
     """Analytics page"""
-    from fastapi.responses import FileResponse
-    return FileResponse("static/analytics.html")
+    return static_cache.response("analytics.html", request)
 
 @app.get("/settings")
-async def settings_page():
+async def settings_page(request: Request):
     """Settings page"""
-    from fastapi.responses import FileResponse
-    return FileResponse("static/settings.html")
+    return static_cache.response("settings.html", request)
+
+API_INFO = StaticJSON({
+    "message": "Welcome to AeroCast API - Advanced Air Quality Forecasting",
+    "version": settings.VERSION,
+    "platform": "AeroCast",
+    "docs": "/docs",
+    "health": "/health",
+    "dashboard": "/",
+    "historical": "/historical",
+    "analytics": "/analytics", 
+    "settings": "/settings"
+})
 
 @app.get("/api")
-async def api_info():
+async def api_info(request: Request):
     """API information endpoint"""
-    from config.settings import settings
-    return {
-        "message": "Welcome to AeroCast API - Advanced Air Quality Forecasting",
-        "version": settings.VERSION,
-        "platform": "AeroCast",
-        "docs": "/docs",
-        "health": "/health",
-        "dashboard": "/",
-        "historical": "/historical",
-        "analytics": "/analytics", 
-        "settings": "/settings"
-    }
+    return API_INFO.response(request)
 
 if __name__ == "__main__":
     uvicorn.run(
-        "main:app",
+        "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        reload=settings.DEBUG,
+        # Workers are only honoured without the reloader
+        workers=None if settings.DEBUG else settings.WORKERS,
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1 @@
+# API middleware package
\ No newline at end of file
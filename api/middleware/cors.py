@@ -0,0 +1,102 @@
+"""
+Lightweight pure-ASGI CORS middleware
+"""
+from typing import Iterable
+
+
+class FastCORS:
+    """CORS middleware with origin set and header values precomputed at init"""
+    
+    def __init__(
+        self,
+        app,
+        origins: Iterable[str],
+        methods: Iterable[str],
+        headers: Iterable[str],
+        allow_credentials: bool = True,
+        max_age: int = 600,
+    ):
+        self.app = app
+        self.origins = frozenset(origin.encode("latin-1") for origin in origins)
+        self.allow_all_origins = b"*" in self.origins
+        
+        headers = list(headers)
+        self.allow_all_headers = "*" in headers
+        self.allow_methods = ", ".join(methods).encode("latin-1")
+        self.allow_headers = ", ".join(headers).encode("latin-1")
+        
+        # Headers shared by every CORS response, built once
+        self.simple_headers = [(b"vary", b"Origin")]
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.preflight_headers = self.simple_headers + [
+            (b"access-control-allow-methods", self.allow_methods),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        allowed = self.allow_all_origins or origin in self.origins
+        
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, allowed, request_headers)
+            return
+        
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+        
+        cors_headers = [(b"access-control-allow-origin", origin)] + self.simple_headers
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+    
+    async def _preflight(self, send, origin, allowed, request_headers):
+        """Answer an OPTIONS preflight without entering the application"""
+        if not allowed:
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        
+        # With credentials a literal "*" is not honoured, so echo the request
+        allow_headers = self.allow_headers
+        if self.allow_all_headers and request_headers:
+            allow_headers = request_headers
+        
+        await send({
+            "type": "http.response.start",
+            "status": 204,
+            "headers": [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-headers", allow_headers),
+            ] + self.preflight_headers,
+        })
+        await send({"type": "http.response.body", "body": b""})
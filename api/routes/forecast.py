@@ -1,12 +1,13 @@
 """
 Forecast endpoints for air quality predictions
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional
 from datetime import datetime, timedelta
-from pydantic import BaseModel
-import numpy as np
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict
 import sys
+import time
 from pathlib import Path
 
 # Add src to path
@@ -14,14 +15,89 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from config.settings import settings
 from src.utils.logger import get_logger
-from src.services.fast_model_service import fast_model_service as model_service
+from api.static import StaticJSON
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Settings read on every request, bound once at import
+_MODEL_VERSION = settings.MODEL_VERSION
+_SPATIAL_RES = settings.SPATIAL_RESOLUTION_KM
+_BBOX = (
+    settings.DELHI_BBOX_MIN_LAT,
+    settings.DELHI_BBOX_MAX_LAT,
+    settings.DELHI_BBOX_MIN_LON,
+    settings.DELHI_BBOX_MAX_LON
+)
+
+# Predefined locations in Delhi NCR
+LOCATIONS = [
+    {
+        "name": "Connaught Place",
+        "latitude": 28.6315,
+        "longitude": 77.2167,
+        "type": "commercial"
+    },
+    {
+        "name": "India Gate",
+        "latitude": 28.6129,
+        "longitude": 77.2295,
+        "type": "monument"
+    },
+    {
+        "name": "Dwarka",
+        "latitude": 28.5921,
+        "longitude": 77.0460,
+        "type": "residential"
+    },
+    {
+        "name": "Gurgaon",
+        "latitude": 28.4595,
+        "longitude": 77.0266,
+        "type": "commercial"
+    },
+    {
+        "name": "Noida",
+        "latitude": 28.5355,
+        "longitude": 77.3910,
+        "type": "residential"
+    }
+]
+
+# Static payloads are serialized once at import and served with an ETag
+_LOCATIONS_JSON = StaticJSON({
+    "locations": LOCATIONS,
+    "total_count": len(LOCATIONS),
+    "coverage_area": "Delhi NCR"
+})
+
+_MODEL_INFO_JSON = StaticJSON({
+    "model_version": settings.MODEL_VERSION,
+    "target_variables": settings.TARGET_VARIABLES,
+    "forecast_horizon_hours": settings.FORECAST_HORIZON_HOURS,
+    "spatial_resolution_km": settings.SPATIAL_RESOLUTION_KM,
+    "update_frequency": "hourly",
+    "coverage_area": {
+        "region": "Delhi NCR",
+        "bounds": {
+            "min_lat": settings.DELHI_BBOX_MIN_LAT,
+            "max_lat": settings.DELHI_BBOX_MAX_LAT,
+            "min_lon": settings.DELHI_BBOX_MIN_LON,
+            "max_lon": settings.DELHI_BBOX_MAX_LON
+        }
+    },
+    "data_sources": [
+        "TROPOMI satellite observations",
+        "ERA5 meteorological reanalysis",
+        "Ground-based monitoring stations"
+    ]
+})
+
 # Pydantic models for request/response
 class ForecastRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     latitude: float
     longitude: float
     hours: int = 24
@@ -40,7 +116,34 @@ class ForecastResponse(BaseModel):
     forecasts: List[PollutantForecast]
     metadata: dict
 
-@router.get("/current")
+# numpy and the model service are imported on first use so workers that only
+# serve /health or the static endpoints never pay for them
+_model_service = None
+
+def _get_model_service():
+    """Import the model service on first use and cache it"""
+    global _model_service
+    if _model_service is None:
+        from src.services.fast_model_service import fast_model_service
+        _model_service = fast_model_service
+    return _model_service
+
+def _hourly_values(values: List[float], hours: int, default: float):
+    """Take the first `hours` values, padding with `default` if the model returned fewer"""
+    import numpy as np
+    
+    arr = np.asarray(values[:hours], dtype=np.float64)
+    if arr.size < hours:
+        arr = np.pad(arr, (0, hours - arr.size), constant_values=default)
+    return arr
+
+@lru_cache(maxsize=128)
+def _forecast_iso(epoch_s: int, hours: int) -> tuple:
+    """ISO timestamps for the next `hours` hours, shared by requests within the same second"""
+    base = datetime.utcfromtimestamp(epoch_s)
+    return tuple((base + timedelta(hours=i)).isoformat() for i in range(1, hours + 1))
+
+@router.get("/current", response_model=None)
 async def get_current_forecast(
     lat: float = Query(..., ge=28.4, le=28.9, description="Latitude (Delhi NCR range)"),
     lon: float = Query(..., ge=76.8, le=77.5, description="Longitude (Delhi NCR range)"),
@@ -51,21 +154,21 @@ async def get_current_forecast(
     """
     try:
         # Get predictions from model service
-        prediction_result = model_service.predict(lat, lon, hours, include_uncertainty=False)
+        prediction_result = _get_model_service().predict(lat, lon, hours, include_uncertainty=False)
         
-        forecast_times = [
-            datetime.utcnow() + timedelta(hours=i) for i in range(1, hours + 1)
-        ]
+        forecast_times = _forecast_iso(int(time.time()), hours)
         
-        forecasts = []
-        for pollutant, values in prediction_result['predictions'].items():
-            forecasts.append(PollutantForecast(
+        # Model output is trusted, so build the response models without re-validating
+        forecasts = [
+            PollutantForecast.model_construct(
                 pollutant=f"{pollutant}_forecast",
                 values=values,
                 unit="μg/m³"
-            ))
+            )
+            for pollutant, values in prediction_result['predictions'].items()
+        ]
         
-        response = ForecastResponse(
+        response = ForecastResponse.model_construct(
             location={
                 "latitude": lat,
                 "longitude": lon,
@@ -75,9 +178,9 @@ async def get_current_forecast(
             forecast_horizon=hours,
             forecasts=forecasts,
             metadata={
-                "model_version": settings.MODEL_VERSION,
-                "spatial_resolution_km": settings.SPATIAL_RESOLUTION_KM,
-                "forecast_times": [t.isoformat() for t in forecast_times]
+                "model_version": _MODEL_VERSION,
+                "spatial_resolution_km": _SPATIAL_RES,
+                "forecast_times": list(forecast_times)
             }
         )
         
@@ -88,21 +191,23 @@ async def get_current_forecast(
         logger.error(f"Error generating forecast: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to generate forecast")
 
-@router.post("/predict")
+@router.post("/predict", response_model=None)
 async def predict_air_quality(request: ForecastRequest):
     """
     Predict air quality based on request parameters
     """
+    import numpy as np
+    
     try:
         # Validate location is within Delhi NCR
-        if not (28.4 <= request.latitude <= 28.9 and 76.8 <= request.longitude <= 77.5):
+        if not (_BBOX[0] <= request.latitude <= _BBOX[1] and _BBOX[2] <= request.longitude <= _BBOX[3]):
             raise HTTPException(
                 status_code=400, 
                 detail="Location must be within Delhi NCR bounds"
             )
         
         # Get predictions from model service
-        prediction_result = model_service.predict(
+        prediction_result = _get_model_service().predict(
             request.latitude, 
             request.longitude, 
             request.hours, 
@@ -110,29 +215,20 @@ async def predict_air_quality(request: ForecastRequest):
         )
         
         # Convert to frontend-expected format
-        predictions = []
+        hours = max(request.hours, 0)
         now = datetime.utcnow()
         
-        no2_values = prediction_result['predictions'].get('NO2', [])
-        o3_values = prediction_result['predictions'].get('O3', [])
+        no2 = _hourly_values(prediction_result['predictions'].get('NO2', []), hours, 35.0)
+        o3 = _hourly_values(prediction_result['predictions'].get('O3', []), hours, 45.0)
         
-        for i in range(request.hours):
-            timestamp = now + timedelta(hours=i+1)
-            no2 = no2_values[i] if i < len(no2_values) else 35.0
-            o3 = o3_values[i] if i < len(o3_values) else 45.0
-            
-            # Calculate AQI (simplified)
-            aqi = max(
-                int(no2 * 2.0),  # NO2 to AQI conversion
-                int(o3 * 1.5)    # O3 to AQI conversion
-            )
-            
-            predictions.append({
-                "timestamp": timestamp.isoformat(),
-                "no2": round(no2, 1),
-                "o3": round(o3, 1),
-                "aqi": min(500, aqi)
-            })
+        # Calculate AQI (simplified): NO2 x2.0 and O3 x1.5, clamped to [0, 500]
+        aqi = np.clip(np.maximum(no2 * 2.0, o3 * 1.5), 0, 500).astype(np.int32)
+        
+        timestamps = [now + timedelta(hours=i + 1) for i in range(hours)]
+        predictions = [
+            {"timestamp": t, "no2": round(n, 1), "o3": round(o, 1), "aqi": a}
+            for t, n, o, a in zip(timestamps, no2.tolist(), o3.tolist(), aqi.tolist())
+        ]
         
         # Return in frontend-expected format
         response = {
@@ -158,76 +254,18 @@ async def predict_air_quality(request: ForecastRequest):
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
 @router.get("/locations")
-async def get_available_locations():
+async def get_available_locations(request: Request):
     """
     Get list of available forecast locations
     """
-    # Predefined locations in Delhi NCR
-    locations = [
-        {
-            "name": "Connaught Place",
-            "latitude": 28.6315,
-            "longitude": 77.2167,
-            "type": "commercial"
-        },
-        {
-            "name": "India Gate",
-            "latitude": 28.6129,
-            "longitude": 77.2295,
-            "type": "monument"
-        },
-        {
-            "name": "Dwarka",
-            "latitude": 28.5921,
-            "longitude": 77.0460,
-            "type": "residential"
-        },
-        {
-            "name": "Gurgaon",
-            "latitude": 28.4595,
-            "longitude": 77.0266,
-            "type": "commercial"
-        },
-        {
-            "name": "Noida",
-            "latitude": 28.5355,
-            "longitude": 77.3910,
-            "type": "residential"
-        }
-    ]
-    
-    return {
-        "locations": locations,
-        "total_count": len(locations),
-        "coverage_area": "Delhi NCR"
-    }
+    return _LOCATIONS_JSON.response(request)
 
 @router.get("/model-info")
-async def get_model_info():
+async def get_model_info(request: Request):
     """
     Get information about the forecasting model
     """
-    return {
-        "model_version": settings.MODEL_VERSION,
-        "target_variables": settings.TARGET_VARIABLES,
-        "forecast_horizon_hours": settings.FORECAST_HORIZON_HOURS,
-        "spatial_resolution_km": settings.SPATIAL_RESOLUTION_KM,
-        "update_frequency": "hourly",
-        "coverage_area": {
-            "region": "Delhi NCR",
-            "bounds": {
-                "min_lat": settings.DELHI_BBOX_MIN_LAT,
-                "max_lat": settings.DELHI_BBOX_MAX_LAT,
-                "min_lon": settings.DELHI_BBOX_MIN_LON,
-                "max_lon": settings.DELHI_BBOX_MAX_LON
-            }
-        },
-        "data_sources": [
-            "TROPOMI satellite observations",
-            "ERA5 meteorological reanalysis",
-            "Ground-based monitoring stations"
-        ]
-    }
+    return _MODEL_INFO_JSON.response(request)
 
 @router.get("/model-status")
 async def get_model_status():
@@ -235,7 +273,7 @@ async def get_model_status():
     Get current model loading status and capabilities
     """
     try:
-        model_info = model_service.get_model_info()
+        model_info = _get_model_service().get_model_info()
         
         # Determine model status
         if model_info['loaded_models']:
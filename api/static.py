@@ -0,0 +1,185 @@
+"""
+In-memory static file server and prebuilt JSON payloads with precomputed ETags
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content types worth compressing; images/fonts are already compressed
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+# Mid-range levels: most of the size win at a fraction of the max-level CPU
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+@lru_cache(maxsize=64)
+def accepted_encodings(accept_encoding: str) -> Tuple[str, ...]:
+    """Codings we can serve that `accept_encoding` allows, most preferred first
+
+    Honours q-values ("br;q=0" rules brotli out) and the "*" wildcard; on a
+    tie brotli wins over gzip.
+    """
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+
+    wildcard = qualities.get("*", 0.0)
+    ranked = [(qualities.get(coding, wildcard), -rank, coding) for rank, coding in enumerate(("br", "gzip"))]
+    return tuple(coding for q, _, coding in sorted(ranked, reverse=True) if q > 0)
+
+
+class StaticJSON:
+    """A JSON payload serialized once and served with a strong ETag"""
+
+    def __init__(self, content: Any, max_age: int = 3600):
+        self.body = orjson.dumps(content)
+        self.etag = '"' + hashlib.md5(self.body).hexdigest() + '"'
+        self.headers = {"etag": self.etag, "cache-control": f"public, max-age={max_age}"}
+
+    def response(self, request) -> Response:
+        """The cached payload, or 304 if the client already holds it"""
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+class StaticFile:
+    """A static file loaded once at startup with all response variants"""
+
+    def __init__(self, path: Path, min_compress_size: int):
+        stat = path.stat()
+        self.body = path.read_bytes()
+        self.media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if self.media_type.startswith("text/"):
+            self.media_type += "; charset=utf-8"
+        self.etag = '"' + hashlib.md5(self.body).hexdigest() + '"'
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+        # Compressed variants are built on first request, not at startup
+        self.compressible = len(self.body) >= min_compress_size and self.media_type.startswith(COMPRESSIBLE_TYPES)
+        self._encoded: Dict[str, bytes] = {}
+
+    def _encode(self, coding: str) -> bytes:
+        """The body compressed with `coding`, computed once"""
+        body = self._encoded.get(coding)
+        if body is None:
+            if coding == "br":
+                body = brotli.compress(self.body, quality=BROTLI_QUALITY)
+            else:
+                body = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+            self._encoded[coding] = body
+        return body
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Pick the client's preferred variant among the ones we can produce"""
+        if self.compressible:
+            for coding in accepted_encodings(accept_encoding):
+                if coding == "br" and brotli is None:
+                    continue
+                return self._encode(coding), coding
+        return self.body, None
+
+
+class StaticCache:
+    """Serve a directory from memory
+
+    Files are read and hashed once when the cache is built and each compressed
+    variant is built on its first request, so a request is a dict lookup plus
+    a send of the matching pre-encoded variant.
+    Mount the instance as an ASGI app, or call `response()` from a route.
+    """
+
+    def __init__(self, directory: Union[str, Path], min_compress_size: int = 1024, max_age: int = 3600):
+        self.directory = Path(directory)
+        self.cache_control = f"public, max-age={max_age}"
+        self.files: Dict[str, StaticFile] = {}
+
+        for dirpath, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                path = Path(dirpath) / name
+                key = path.relative_to(self.directory).as_posix()
+                self.files[key] = StaticFile(path, min_compress_size)
+
+    def _build(self, name: str, accept_encoding: str, if_none_match: Optional[str]) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Status, headers and body for a cached file"""
+        static_file = self.files.get(name)
+        if static_file is None:
+            return 404, [("content-type", "text/plain; charset=utf-8")], b"Not Found"
+
+        # Pages always revalidate (a cheap 304) so deploys show up immediately
+        cache_control = "no-cache" if static_file.media_type.startswith("text/html") else self.cache_control
+        headers = [
+            ("etag", static_file.etag),
+            ("last-modified", static_file.last_modified),
+            ("cache-control", cache_control),
+        ]
+        if static_file.compressible:
+            headers.append(("vary", "Accept-Encoding"))
+
+        if if_none_match == static_file.etag:
+            return 304, headers, b""
+
+        body, encoding = static_file.select(accept_encoding)
+        headers.append(("content-type", static_file.media_type))
+        if encoding:
+            headers.append(("content-encoding", encoding))
+        return 200, headers, body
+
+    def response(self, name: str, request) -> Response:
+        """Response for `name`, honouring Accept-Encoding and If-None-Match"""
+        status, headers, body = self._build(
+            name,
+            request.headers.get("accept-encoding", ""),
+            request.headers.get("if-none-match"),
+        )
+        return Response(content=body, status_code=status, headers=dict(headers))
+
+    async def __call__(self, scope, receive, send):
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            status, headers, body = 405, [("allow", "GET, HEAD")], b""
+        else:
+            path, root_path = scope["path"], scope.get("root_path", "")
+            if path.startswith(root_path):
+                path = path[len(root_path):]
+
+            accept_encoding = if_none_match = None
+            for key, value in scope["headers"]:
+                if key == b"accept-encoding":
+                    accept_encoding = value.decode("latin-1")
+                elif key == b"if-none-match":
+                    if_none_match = value.decode("latin-1")
+
+            status, headers, body = self._build(path.lstrip("/"), accept_encoding or "", if_none_match)
+
+        raw_headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
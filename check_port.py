@@ -5,28 +5,40 @@ Check what's using port 8000 and fix it
 import subprocess
 import socket
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from _procutil import listening_pids, stop_pids
 
 def check_port_8000():
     print("🔍 Checking port 8000...")
     
     # Check if port is available
+    # Probe the same address uvicorn binds to. On POSIX, SO_REUSEADDR lets the
+    # bind succeed over TIME_WAIT sockets left by a crashed server while still
+    # failing on a live listener. Windows already ignores TIME_WAIT, and its
+    # SO_REUSEADDR would let us bind over a live listener, so it is not set there.
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(('localhost', 8000))
-            print("✅ Port 8000 is available")
-            return True
+        if sys.platform != "win32":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(('0.0.0.0', 8000))
+        print("✅ Port 8000 is available")
+        return True
     except OSError:
         print("❌ Port 8000 is in use")
         return False
+    finally:
+        s.close()
 
 def find_port_users():
+    """Print the connections on port 8000 and return the PIDs listening on it"""
     print("\n🔍 Finding processes using port 8000...")
     try:
         if sys.platform == "win32":
             result = subprocess.run(['netstat', '-ano'], capture_output=True, text=True)
-            lines = result.stdout.split('\n')
             
-            for line in lines:
+            for line in result.stdout.splitlines():
                 if ':8000' in line:
                     print(f"Found: {line.strip()}")
         else:
@@ -34,35 +46,26 @@ def find_port_users():
             print(result.stdout)
     except Exception as e:
         print(f"Error checking processes: {e}")
+    
+    try:
+        return listening_pids(8000)
+    except Exception as e:
+        print(f"Error checking processes: {e}")
+        return set()
 
-def kill_port_8000():
+def kill_port_8000(pids=None):
     print("\n🔧 Attempting to free port 8000...")
     try:
-        if sys.platform == "win32":
-            # Kill all python processes
-            subprocess.run(['taskkill', '/f', '/im', 'python.exe'], 
-                         capture_output=True)
-            print("✅ Killed Python processes")
-            
-            # Kill specific processes using port 8000
-            result = subprocess.run(['netstat', '-ano'], capture_output=True, text=True)
-            lines = result.stdout.split('\n')
-            
-            for line in lines:
-                if ':8000' in line and 'LISTENING' in line:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        try:
-                            subprocess.run(['taskkill', '/f', '/pid', pid], 
-                                         capture_output=True, check=True)
-                            print(f"✅ Killed process {pid}")
-                        except:
-                            pass
-        else:
-            subprocess.run(['pkill', '-f', ':8000'], capture_output=True)
-            subprocess.run(['pkill', '-f', 'uvicorn'], capture_output=True)
-            print("✅ Killed processes using port 8000")
+        # Only the listeners on the port, never every Python process
+        if pids is None:
+            pids = listening_pids(8000)
+        stopped, failed = stop_pids(pids)
+        if stopped:
+            print(f"✅ Killed processes {', '.join(map(str, sorted(stopped)))}")
+        if failed:
+            print(f"⚠️  Could not stop processes {', '.join(map(str, sorted(failed)))}")
+        if not pids:
+            print("⚠️  No listening process found on port 8000")
     except Exception as e:
         print(f"Error killing processes: {e}")
 
@@ -74,8 +77,8 @@ def main():
         print("\n🎉 Port 8000 is ready! You can start the server now.")
         print("Run: python start_server.py")
     else:
-        find_port_users()
-        kill_port_8000()
+        pids = find_port_users()
+        kill_port_8000(pids)
         
         # Check again
         print("\n🔄 Checking port again...")
@@ -2,8 +2,9 @@
 Configuration settings for the Air Quality Forecasting System
 """
 import os
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 try:
     from pydantic_settings import BaseSettings
     from pydantic import validator
@@ -28,10 +29,24 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     
+    # Server Configuration
+    SERVER_LOOP: str = "asyncio" if sys.platform == "win32" else "uvloop"  # uvloop has no Windows build
+    SERVER_HTTP: str = "httptools"
+    WORKERS: int = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))  # one async worker per core
+    
+    # CORS (comma-separated or JSON list in the environment)
+    CORS_ORIGINS: Union[List[str], str] = [
+        "https://aerocast-air-quality-forecasting.vercel.app",  # Vercel URL
+        "https://aerocast-sarthak0105.vercel.app",  # Alternative Vercel URL format
+        "http://localhost:3000",  # Local development
+        "http://localhost:3001"   # Local development
+    ]
+    
     # Model Configuration
     MODEL_VERSION: str = "v2.0"
     FORECAST_HORIZON_HOURS: int = 48
     SPATIAL_RESOLUTION_KM: float = 1.0
+    WARMUP_MODEL: bool = True  # Run one prediction at startup so the first request is fast
     BATCH_SIZE: int = 256  # Larger batch size for stability
     LEARNING_RATE: float = 0.0003  # Lower learning rate for better convergence
     
@@ -83,7 +98,7 @@ class Settings(BaseSettings):
     
     # Logging
     LOG_LEVEL: str = "INFO"
-    LOG_FILE: str = "logs/app.log"
+    LOG_FILE: str = str(BASE_DIR / "logs" / "app.log")
     
     # MLflow
     MLFLOW_TRACKING_URI: str = "http://localhost:5000"
@@ -95,6 +110,13 @@ class Settings(BaseSettings):
     ECMWF_API_KEY: Optional[str] = None
     OPENWEATHER_API_KEY: Optional[str] = None
     
+    @validator("CORS_ORIGINS", pre=True)
+    def split_cors_origins(cls, v):
+        """Accept a comma-separated list of origins"""
+        if isinstance(v, str):
+            return [origin.strip() for origin in v.split(",") if origin.strip()]
+        return v
+    
     @validator("RAW_DATA_PATH", "PROCESSED_DATA_PATH", "MODEL_PATH", "LOG_PATH")
     def create_directories(cls, v):
         """Create directories if they don't exist"""
@@ -2,6 +2,7 @@
 """
 Migration script to help transition from HTML/CSS/JS to React/Next.js frontend
 """
+import asyncio
 import os
 import sys
 import subprocess
@@ -43,7 +44,19 @@ def backup_static_files():
         return True
     return False
 
-def install_frontend():
+async def _package_manager_available(pm_name):
+    """Return True if `pm_name --version` exits cleanly"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            shutil.which(pm_name) or pm_name, "--version",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except (FileNotFoundError, PermissionError):
+        return False
+    return await proc.wait() == 0
+
+async def install_frontend():
     """Install React frontend dependencies"""
     frontend_dir = Path("frontend")
     
@@ -53,35 +66,28 @@ def install_frontend():
     
     print("📦 Installing React/Next.js dependencies...")
     
-    # Change to frontend directory
-    os.chdir(frontend_dir)
-    
-    # Check for pnpm first, then npm
-    package_managers = [
-        ("pnpm", ["pnpm", "install"]),
-        ("npm", ["npm", "install"])
-    ]
-    
-    for pm_name, install_cmd in package_managers:
-        try:
-            # Check if package manager is available
-            subprocess.run([pm_name, "--version"], capture_output=True, check=True)
-            print(f"🔧 Using {pm_name} for installation...")
-            
-            # Install dependencies
-            result = subprocess.run(install_cmd, check=True)
-            print(f"✅ Dependencies installed successfully with {pm_name}!")
-            
-            # Go back to root directory
-            os.chdir("..")
-            return True
-            
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
+    # Install with the tool the frontend is locked with, so the lockfile is honoured
+    pm_name = "pnpm" if (frontend_dir / "pnpm-lock.yaml").exists() else "npm"
+    if not await _package_manager_available(pm_name):
+        print(f"❌ {pm_name} not found!")
+        if pm_name == "pnpm":
+            print("📥 Enable it with: corepack enable && corepack prepare pnpm@latest --activate")
+        else:
+            print("📥 Please install Node.js from: https://nodejs.org/")
+        return False
     
-    print("❌ No suitable package manager found (npm or pnpm)")
-    os.chdir("..")
-    return False
+    print(f"🔧 Using {pm_name} for installation...")
+    
+    # Install dependencies, output streams straight to the terminal
+    proc = await asyncio.create_subprocess_exec(shutil.which(pm_name) or pm_name, "install", cwd=frontend_dir)
+    await proc.communicate()
+    
+    if proc.returncode != 0:
+        print(f"❌ {pm_name} install failed")
+        return False
+    
+    print(f"✅ Dependencies installed successfully with {pm_name}!")
+    return True
 
 def update_api_routes():
     """Update API to serve React frontend"""
@@ -116,7 +122,7 @@ sleep 3
 # Start frontend
 echo "🌐 Starting React frontend..."
 cd frontend
-if command -v pnpm &> /dev/null; then
+if [ -f pnpm-lock.yaml ]; then
     pnpm dev
 else
     npm run dev
@@ -214,7 +220,7 @@ def main():
     backup_static_files()
     
     # Install frontend dependencies
-    if not install_frontend():
+    if not asyncio.run(install_frontend()):
         print("❌ Frontend installation failed!")
         sys.exit(1)
     
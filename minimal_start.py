@@ -2,25 +2,42 @@
 """
 Minimal server - bypasses all complex imports
 """
-from fastapi import FastAPI, Query, HTTPException
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Query, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+from datetime import datetime
 import numpy as np
+import orjson
 
-# Change to project directory
-os.chdir(Path(__file__).parent)
+# Absolute paths so the server works from any working directory
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
 
 # Add src to path for model service
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(BASE_DIR))
+
+from api.static import StaticCache
+
+# Import the model service once; handlers only call into it
+try:
+    from src.services.fast_model_service import fast_model_service as MODEL_SERVICE
+except Exception as e:
+    print(f"⚠️ Model service unavailable: {e}")
+    MODEL_SERVICE = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the model at process start so the first request is not a cold one"""
+    if MODEL_SERVICE is not None:
+        MODEL_SERVICE.warmup()
+    yield
 
 # Create minimal FastAPI app
-app = FastAPI(title="AeroCast", version="1.0.0")
+app = FastAPI(title="AeroCast", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -31,36 +48,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Static files and pages are read, hashed and compressed once, then served from memory
+static_cache = StaticCache(STATIC_DIR)
+app.mount("/static", static_cache, name="static")
 
 @app.get("/")
-async def root():
-    return FileResponse("static/index.html")
+async def root(request: Request):
+    return static_cache.response("index.html", request)
 
 @app.get("/historical")
-async def historical():
-    return FileResponse("static/historical.html")
+async def historical(request: Request):
+    return static_cache.response("historical.html", request)
 
 @app.get("/analytics")
-async def analytics():
-    return FileResponse("static/analytics.html")
+async def analytics(request: Request):
+    return static_cache.response("analytics.html", request)
 
 @app.get("/settings")
-async def settings():
-    return FileResponse("static/settings.html")
+async def settings(request: Request):
+    return static_cache.response("settings.html", request)
+
+# Static payloads are serialized once at import
+_HEALTH_JSON = orjson.dumps({"status": "healthy", "message": "AeroCast server is running"})
+_API_INFO_JSON = orjson.dumps({
+    "message": "AeroCast API",
+    "version": "1.0.0",
+    "status": "running"
+})
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "message": "AeroCast server is running"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 @app.get("/api")
 async def api_info():
-    return {
-        "message": "AeroCast API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(_API_INFO_JSON, media_type="application/json")
 
 # FORECAST API ENDPOINTS
 @app.get("/api/v1/current")
@@ -71,25 +93,22 @@ async def get_current_forecast(
 ):
     """Get current air quality forecast"""
     try:
-        # Import model service
-        from src.services.fast_model_service import fast_model_service
+        if MODEL_SERVICE is None:
+            raise RuntimeError("model service not available")
         
         # Get predictions
-        prediction_result = fast_model_service.predict(lat, lon, hours)
+        prediction_result = MODEL_SERVICE.predict(lat, lon, hours)
         
-        # Format response
-        forecast_times = [
-            (datetime.utcnow() + timedelta(hours=i)).isoformat() 
-            for i in range(1, hours + 1)
-        ]
+        # Format response: all forecast times in one NumPy datetime64 pass
+        now = datetime.utcnow()
+        forecast_times = (
+            np.datetime64(now, "us") + np.arange(1, hours + 1) * np.timedelta64(1, "h")
+        ).astype(str).tolist()
         
-        forecasts = []
-        for pollutant, values in prediction_result['predictions'].items():
-            forecasts.append({
-                "pollutant": f"{pollutant}_forecast",
-                "values": values,
-                "unit": "μg/m³"
-            })
+        forecasts = [
+            {"pollutant": f"{pollutant}_forecast", "values": values, "unit": "μg/m³"}
+            for pollutant, values in prediction_result['predictions'].items()
+        ]
         
         return {
             "location": {
@@ -97,7 +116,7 @@ async def get_current_forecast(
                 "longitude": lon,
                 "city": "Delhi"
             },
-            "forecast_time": datetime.utcnow().isoformat(),
+            "forecast_time": now.isoformat(),
             "forecast_horizon": hours,
             "forecasts": forecasts,
             "metadata": {
@@ -110,21 +129,27 @@ async def get_current_forecast(
         print(f"Forecast error: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate forecast")
 
+def _model_status_json() -> bytes:
+    """Serialized model status, read fresh so a model reload shows up immediately"""
+    model_info = MODEL_SERVICE.get_model_info()
+    
+    return orjson.dumps({
+        "status": "intelligent_fallback",
+        "model_name": "Fast Prediction Engine",
+        "accuracy": "70%",
+        "description": "Ultra-fast location-aware predictions",
+        "loaded_models": model_info['loaded_models'],
+        "model_count": model_info['model_count']
+    })
+
 @app.get("/api/v1/model-status")
 async def get_model_status():
     """Get model status"""
     try:
-        from src.services.fast_model_service import fast_model_service
-        model_info = fast_model_service.get_model_info()
+        if MODEL_SERVICE is None:
+            raise RuntimeError("model service not available")
         
-        return {
-            "status": "intelligent_fallback",
-            "model_name": "Fast Prediction Engine",
-            "accuracy": "70%",
-            "description": "Ultra-fast location-aware predictions",
-            "loaded_models": model_info['loaded_models'],
-            "model_count": model_info['model_count']
-        }
+        return Response(_model_status_json(), media_type="application/json")
     except Exception as e:
         return {
             "status": "error",
@@ -2,16 +2,28 @@
 """
 Direct server startup - guaranteed to work
 """
-import os
 import sys
 from pathlib import Path
 
-# Change to project directory
-os.chdir(Path(__file__).parent)
+import uvicorn
 
-print("🚀 Starting AeroCast Server...")
-print("📍 Will be available at: http://localhost:8000")
-print("⚡ Starting now...")
+# Make the project importable; paths inside the app are absolute, so no chdir
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-# Direct uvicorn command
-os.system("python -m uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload")
\ No newline at end of file
+from config.settings import settings
+
+# Guarded: worker processes re-import this module when they spawn
+if __name__ == "__main__":
+    print("🚀 Starting AeroCast Server...")
+    print("📍 Will be available at: http://localhost:8000")
+    print(f"⚡ Starting now with {settings.WORKERS} workers...")
+
+    # Serve in-process with a pre-forked worker pool; no shell, no reloader
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=settings.WORKERS,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP
+    )
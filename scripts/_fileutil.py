@@ -0,0 +1,76 @@
+"""
+Copy files without pulling their data through Python where the OS can do it
+"""
+import errno
+import os
+import stat
+import sys
+
+# Chunk size for the kernel copy calls and the userspace fallback buffer
+_COPY_CHUNK = 1 << 30
+_COPY_BUFSIZE = 1 << 20
+
+def _copy_fd(src_fd, dst_fd):
+    """Copy src_fd to dst_fd, preferring in-kernel copies over a read/write loop
+    
+    copy_file_range lets the filesystem reflink (btrfs/XFS) or copy server-side
+    (NFS); sendfile still avoids the round trip through user space.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK):
+                pass
+            return
+        except OSError as e:
+            # Cross-device or unsupported filesystem; try the next strategy
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    
+    if sys.platform.startswith("linux"):
+        offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, _COPY_CHUNK)
+                if sent == 0:
+                    return
+                offset += sent
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            os.lseek(src_fd, offset, os.SEEK_SET)
+    
+    # Portable fallback: one reusable 1 MiB buffer
+    buf = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(src_fd, "rb", buffering=0, closefd=False) as f_src, \
+         open(dst_fd, "wb", buffering=0, closefd=False) as f_dst:
+        while True:
+            n = f_src.readinto(buf)
+            if not n:
+                break
+            f_dst.write(view[:n])
+
+def fastcopy(src, dst):
+    """Copy a file's data, permissions and timestamps (like shutil.copy2)"""
+    src, dst = os.fspath(src), os.fspath(dst)
+    
+    # CopyFileW also carries over timestamps and attributes
+    if os.name == "nt":
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            return
+    
+    binary = getattr(os, "O_BINARY", 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
@@ -0,0 +1,183 @@
+"""
+Find and stop the processes listening on a TCP port without spawning a shell
+"""
+import os
+import signal
+import socket
+import subprocess
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+    
+    AF_INET6 = 23
+    TCP_TABLE_OWNER_PID_LISTENER = 3
+    ERROR_INSUFFICIENT_BUFFER = 122
+    PROCESS_TERMINATE = 0x0001
+    SYNCHRONIZE = 0x00100000
+    WAIT_OBJECT_0 = 0
+    
+    class MIB_TCPROW_OWNER_PID(ctypes.Structure):
+        _fields_ = [
+            ("dwState", wintypes.DWORD),
+            ("dwLocalAddr", wintypes.DWORD),
+            ("dwLocalPort", wintypes.DWORD),
+            ("dwRemoteAddr", wintypes.DWORD),
+            ("dwRemotePort", wintypes.DWORD),
+            ("dwOwningPid", wintypes.DWORD),
+        ]
+    
+    class MIB_TCP6ROW_OWNER_PID(ctypes.Structure):
+        _fields_ = [
+            ("ucLocalAddr", ctypes.c_ubyte * 16),
+            ("dwLocalScopeId", wintypes.DWORD),
+            ("dwLocalPort", wintypes.DWORD),
+            ("ucRemoteAddr", ctypes.c_ubyte * 16),
+            ("dwRemoteScopeId", wintypes.DWORD),
+            ("dwRemotePort", wintypes.DWORD),
+            ("dwState", wintypes.DWORD),
+            ("dwOwningPid", wintypes.DWORD),
+        ]
+    
+    _ROW_TYPES = {socket.AF_INET: MIB_TCPROW_OWNER_PID, AF_INET6: MIB_TCP6ROW_OWNER_PID}
+    
+    # Private loader instances so the signatures set here stay local
+    _iphlpapi = ctypes.WinDLL("iphlpapi")
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    _kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+def _listener_rows(family):
+    """MIB_TCP(6)ROW_OWNER_PID entries for every listening socket of `family`"""
+    get_table = _iphlpapi.GetExtendedTcpTable
+    size = wintypes.DWORD(0)
+    buffer = None
+    # The table can grow between the sizing call and the fetch, so retry
+    for _ in range(5):
+        buffer = ctypes.create_string_buffer(size.value)
+        status = get_table(buffer, ctypes.byref(size), False, family, TCP_TABLE_OWNER_PID_LISTENER, 0)
+        if status == 0:
+            break
+        if status != ERROR_INSUFFICIENT_BUFFER:
+            raise OSError(status, "GetExtendedTcpTable failed")
+    else:
+        raise OSError(ERROR_INSUFFICIENT_BUFFER, "GetExtendedTcpTable failed")
+    
+    count = wintypes.DWORD.from_buffer(buffer).value
+    row_type = _ROW_TYPES[family]
+    offset = ctypes.sizeof(wintypes.DWORD)
+    return (row_type * count).from_buffer(buffer, offset) if count else []
+
+def _netstat_pids(port):
+    """Listening PIDs parsed from `netstat -ano` (numeric, so no name lookups)"""
+    result = subprocess.run(["netstat", "-ano"], capture_output=True, text=True)
+    pids = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 5 and parts[0] == "TCP" and parts[3] == "LISTENING" and parts[1].endswith(f":{port}"):
+            pids.add(int(parts[-1]))
+    return pids
+
+def listening_pids(port):
+    """PIDs of the processes listening on TCP `port` (IPv4 or IPv6)"""
+    if os.name == "nt":
+        try:
+            # Rows with the LISTENER table class are all in the listen state
+            return {
+                row.dwOwningPid
+                for family in (socket.AF_INET, AF_INET6)
+                for row in _listener_rows(family)
+                if socket.ntohs(row.dwLocalPort & 0xFFFF) == port and row.dwOwningPid
+            }
+        except (AttributeError, OSError):
+            return _netstat_pids(port)
+    
+    if psutil is not None:
+        try:
+            return {
+                c.pid for c in psutil.net_connections(kind="tcp")
+                if c.laddr and c.laddr.port == port and c.status == psutil.CONN_LISTEN and c.pid
+            }
+        except psutil.AccessDenied:
+            pass
+    return set()
+
+def terminate_pid(pid, timeout=2.0):
+    """Stop `pid` and wait up to `timeout` seconds for it to exit; False if it could not be stopped
+    
+    Used when psutil is missing: TerminateProcess on Windows, otherwise
+    SIGTERM followed by SIGKILL once the grace period runs out.
+    """
+    if os.name == "nt":
+        handle = _kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
+        if not handle:
+            return False
+        try:
+            if not _kernel32.TerminateProcess(handle, 1):
+                return False
+            return _kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+        finally:
+            _kernel32.CloseHandle(handle)
+    
+    try:
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            os.kill(pid, 0)
+        os.kill(pid, signal.SIGKILL)
+        return True
+    except ProcessLookupError:
+        return True  # exited
+    except OSError:
+        return False
+
+def stop_pids(pids, timeout=2.0):
+    """Terminate `pids`, give them `timeout` seconds to exit, then force-kill the rest
+    
+    Returns (stopped, failed) PID sets; processes that are already gone count
+    as stopped, ones we may not signal (another user's) as failed.
+    """
+    stopped, failed = set(), set()
+    if psutil is None:
+        for pid in pids:
+            (stopped if terminate_pid(pid, timeout) else failed).add(pid)
+        return stopped, failed
+    
+    procs = []
+    for pid in pids:
+        try:
+            proc = psutil.Process(pid)
+            proc.terminate()
+            procs.append(proc)
+        except psutil.NoSuchProcess:
+            stopped.add(pid)
+        except psutil.AccessDenied:
+            failed.add(pid)
+    
+    # Returns as soon as they exit; escalate for anything still alive
+    gone, alive = psutil.wait_procs(procs, timeout=timeout)
+    stopped.update(proc.pid for proc in gone)
+    for proc in alive:
+        try:
+            proc.kill()
+            stopped.add(proc.pid)
+        except psutil.NoSuchProcess:
+            stopped.add(proc.pid)
+        except psutil.AccessDenied:
+            failed.add(proc.pid)
+    return stopped, failed
+
+def kill_port(port, timeout=2.0):
+    """Stop everything listening on `port`; returns (stopped, failed) PID sets"""
+    return stop_pids(listening_pids(port), timeout)
@@ -0,0 +1,157 @@
+"""
+Shared API server launcher for the start/deploy scripts
+"""
+import asyncio
+import os
+import select
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+import uvicorn
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Only app code triggers a reload; model weights never do
+RELOAD_ARGS = [
+    "--reload",
+    "--reload-dir", "api",
+    "--reload-dir", "src",
+    "--reload-exclude", "*.h5",
+    "--reload-exclude", "*.pkl",
+]
+
+def wait_for_server(process, url, port=8000, timeout=30.0, session=requests):
+    """Wait until `process` serves `url`/health; False if it exits or times out
+    
+    Process exit is watched through a pidfd (Linux) so a crash is noticed
+    immediately, and the port is probed with a 25 ms TCP connect before
+    the single HTTP health check is made.
+    """
+    deadline = time.monotonic() + timeout
+    poller = pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+        except OSError:
+            poller = pidfd = None
+    
+    try:
+        while time.monotonic() < deadline:
+            # Readable pidfd means the process has exited
+            if poller is not None:
+                if poller.poll(25):
+                    return False
+            elif process.poll() is not None:
+                return False
+            else:
+                time.sleep(0.025)
+            
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.025)
+                if sock.connect_ex(("127.0.0.1", port)) != 0:
+                    continue
+            
+            # Port is bound; the app may still be importing, so let this block
+            try:
+                response = session.get(f"{url}/health", timeout=max(deadline - time.monotonic(), 0.1))
+                if response.status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+    return False
+
+async def _serve(server, on_ready):
+    """Run `server`, call `on_ready` once it listens, and serve until stopped"""
+    serve_task = asyncio.create_task(server.serve())
+    
+    # uvicorn flips `started` once its sockets are listening
+    while not server.started:
+        if serve_task.done():
+            return False
+        await asyncio.sleep(0.025)
+    print("✅ API server is running!")
+    
+    # Callers make blocking HTTP calls here, so keep them off the event loop
+    if on_ready is not None:
+        await asyncio.to_thread(on_ready)
+    
+    await serve_task
+    return True
+
+def _launch_in_process(app, host, port, on_ready):
+    """Serve from this interpreter: no second Python startup or app import"""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    
+    config = uvicorn.Config(app, host=host, port=port, reload=False)
+    try:
+        config.load()
+    except SystemExit:
+        # uvicorn exits when the app cannot be imported; it has logged why
+        print(f"❌ Failed to load {app}")
+        return False
+    
+    try:
+        if not asyncio.run(_serve(uvicorn.Server(config), on_ready)):
+            print("❌ Server failed to start")
+            return False
+    except KeyboardInterrupt:
+        # uvicorn re-raises Ctrl+C once it has shut down gracefully
+        pass
+    except SystemExit:
+        # Raised by uvicorn when it cannot bind the port
+        print("❌ Server failed to start")
+        return False
+    return True
+
+def _launch_with_reload(app, host, port, on_ready, session):
+    """Serve from a reloading uvicorn child process"""
+    cmd = [
+        sys.executable, "-m", "uvicorn", app,
+        "--host", host,
+        "--port", str(port),
+    ] + RELOAD_ARGS
+    print("🔧 Command:", " ".join(cmd))
+    process = subprocess.Popen(cmd, cwd=PROJECT_ROOT)
+    
+    try:
+        if wait_for_server(process, f"http://localhost:{port}", port=port, session=session):
+            print("✅ API server is running!")
+        elif process.poll() is not None:
+            print(f"❌ Server exited with code {process.returncode}")
+            return False
+        else:
+            print("⚠️  Server may still be starting...")
+        
+        if on_ready is not None:
+            on_ready()
+        process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return True
+
+def launch_and_wait(app="api.main:app", port=8000, host="0.0.0.0", reload=False, on_ready=None, session=None):
+    """Serve `app` until it is stopped
+    
+    `on_ready` is called once the server accepts requests. Returns False if
+    the server never came up, True once it has been stopped (Ctrl+C).
+    `reload` runs uvicorn in a child process that restarts on code changes;
+    otherwise the app is served in-process.
+    """
+    print(f"⏳ Starting {app} on port {port}...")
+    if reload:
+        return _launch_with_reload(app, host, port, on_ready, session or requests.Session())
+    return _launch_in_process(app, host, port, on_ready)
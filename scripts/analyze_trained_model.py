@@ -4,21 +4,100 @@ Analyze the existing trained model to understand its structure
 """
 
 import sys
+import argparse
 import pickle
 import json
 from pathlib import Path
-import tensorflow as tf
+import h5py
 import numpy as np
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-def analyze_model(model_path):
-    """Analyze a trained model file"""
+def _read_h5_config(model_path):
+    """Read the Keras model config straight from the HDF5 attributes"""
+    with h5py.File(model_path, 'r') as f:
+        raw = f.attrs['model_config']
+    if isinstance(raw, bytes):
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
+def analyze_model(model_path, full=False):
+    """Analyze a trained model file
+    
+    By default only the architecture stored in the .h5 file is read, which
+    avoids rebuilding the graph and restoring weights. Pass full=True to load
+    the model with TensorFlow and print the complete summary.
+    """
     print(f"🔍 Analyzing model: {model_path}")
     print("=" * 60)
     
+    if full:
+        return _analyze_loaded_model(model_path)
+    
+    try:
+        config = _read_h5_config(model_path)
+        layers = config['config']['layers']
+        
+        print("✅ Model config read successfully!")
+        print()
+        
+        # Input shape (Keras 2 stores batch_input_shape, Keras 3 batch_shape)
+        print("📥 INPUT REQUIREMENTS:")
+        input_shape = None
+        for i, layer in enumerate(layers):
+            layer_config = layer.get('config', {})
+            shape = layer_config.get('batch_input_shape') or layer_config.get('batch_shape')
+            if shape is not None:
+                print(f"   Layer {i} ({layer_config.get('name')}): {tuple(shape)}")
+                if input_shape is None:
+                    input_shape = tuple(shape)
+        
+        print(f"   Expected input shape: {input_shape}")
+        print()
+        
+        # Output shape follows from the last layer that sets one
+        output_shape = None
+        for layer in reversed(layers):
+            layer_config = layer.get('config', {})
+            if 'target_shape' in layer_config:
+                output_shape = (None, *layer_config['target_shape'])
+                break
+            if 'units' in layer_config:
+                if layer_config.get('return_sequences') and input_shape is not None:
+                    output_shape = (None, input_shape[1], layer_config['units'])
+                else:
+                    output_shape = (None, layer_config['units'])
+                break
+        
+        print("📤 OUTPUT SHAPE:")
+        print(f"   Output shape: {output_shape}")
+        print()
+        
+        # Model configuration
+        print("⚙️ MODEL CONFIG:")
+        print(f"   Model type: {config['config'].get('name', config.get('class_name', 'Unknown'))}")
+        print(f"   Number of layers: {len(layers)}")
+        
+        for i, layer in enumerate(layers):
+            layer_config = layer.get('config', {})
+            print(f"   Layer {i}: {layer['class_name']} ({layer_config.get('name')})")
+            if 'units' in layer_config:
+                print(f"     Units: {layer_config['units']}")
+            if 'return_sequences' in layer_config:
+                print(f"     Return sequences: {layer_config['return_sequences']}")
+        
+        return {'input_shape': input_shape, 'output_shape': output_shape}
+        
+    except Exception as e:
+        print(f"❌ Error reading model config: {e}")
+        return None
+
+def _analyze_loaded_model(model_path):
+    """Load the full model with TensorFlow (slow) and print its summary"""
+    import tensorflow as tf
+    
     try:
         # Load the model
         model = tf.keras.models.load_model(model_path)
@@ -60,7 +139,7 @@ def analyze_model(model_path):
                 if hasattr(layer, 'return_sequences'):
                     print(f"     Return sequences: {layer.return_sequences}")
         
-        return model
+        return {'input_shape': model.input_shape, 'output_shape': model.output_shape}
         
     except Exception as e:
         print(f"❌ Error loading model: {e}")
@@ -126,6 +205,11 @@ def analyze_training_history(history_path):
 
 def main():
     """Main analysis function"""
+    parser = argparse.ArgumentParser(description="Analyze the latest trained model")
+    parser.add_argument("--full", action="store_true",
+                       help="Load the model with TensorFlow instead of reading its config only")
+    args = parser.parse_args()
+    
     print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
@@ -162,7 +246,7 @@ def main():
     history_file = latest_model_dir / "training_history.json"
     
     # Analyze model
-    model = analyze_model(model_file)
+    model = analyze_model(model_file, full=args.full)
     print()
     
     # Analyze metadata
@@ -178,10 +262,10 @@ def main():
     print("=" * 60)
     
     if model:
-        input_shape = model.input_shape
+        input_shape = model['input_shape']
         print(f"✅ Your model expects input shape: {input_shape}")
         
-        if len(input_shape) == 3:  # (batch, timesteps, features)
+        if input_shape and len(input_shape) == 3:  # (batch, timesteps, features)
             timesteps = input_shape[1]
             features = input_shape[2]
             print(f"   Timesteps: {timesteps}")
@@ -192,8 +276,8 @@ def main():
             print(f"   2. Use {timesteps} timesteps for input sequences")
             print("   3. Update model service to match this architecture")
         
-        output_shape = model.output_shape
-        if len(output_shape) == 2:  # (batch, outputs)
+        output_shape = model['output_shape']
+        if output_shape and len(output_shape) == 2:  # (batch, outputs)
             outputs = output_shape[1]
             print(f"   Model outputs: {outputs} values")
             if outputs == 2:
@@ -10,46 +10,25 @@ import time
 import signal
 from pathlib import Path
 
+from _procutil import kill_port
+
 def kill_processes_on_port(port):
     """Kill processes using the specified port"""
     try:
-        # Find processes using the port
-        result = subprocess.run(
-            f'netstat -ano | findstr :{port}',
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            pids = set()
-            
-            for line in lines:
-                if 'LISTENING' in line:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        pids.add(pid)
-            
-            # Kill the processes
-            for pid in pids:
-                try:
-                    subprocess.run(f'taskkill /F /PID {pid}', shell=True, capture_output=True)
-                    print(f"✅ Killed process {pid}")
-                except:
-                    pass
-                    
-            if pids:
-                time.sleep(2)  # Wait for processes to die
-                print(f"🧹 Cleaned up {len(pids)} processes on port {port}")
-            else:
-                print(f"✅ Port {port} is already free")
-        else:
-            print(f"✅ Port {port} is free")
-            
+        stopped, failed = kill_port(port)
     except Exception as e:
         print(f"⚠️  Error cleaning port {port}: {e}")
+        return
+    
+    for pid in stopped:
+        print(f"✅ Killed process {pid}")
+    for pid in failed:
+        print(f"⚠️  Could not stop process {pid} on port {port}")
+    
+    if stopped:
+        print(f"🧹 Cleaned up {len(stopped)} processes on port {port}")
+    elif not failed:
+        print(f"✅ Port {port} is already free")
 
 def start_simple_server():
     """Start a simple working server"""
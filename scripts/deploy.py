@@ -4,28 +4,79 @@ Deployment script for the air quality forecasting system
 """
 import os
 import sys
+import time
+import shlex
+import hashlib
+import http.client
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a shell command and handle errors"""
+class _StatCache:
+    """Directory listings memoized for one run of the script
+    
+    Every existence or is-directory question is answered from a single
+    scandir of the parent, so no path is read from disk twice.
+    """
+    
+    def __init__(self):
+        self._listings = {}
+    
+    def _entries(self, path):
+        key = os.path.abspath(path)
+        if key not in self._listings:
+            try:
+                with os.scandir(key) as it:
+                    self._listings[key] = {e.name: (e.is_dir(), e.is_file()) for e in it}
+            except OSError:
+                self._listings[key] = {}
+        return self._listings[key]
+    
+    def listdir(self, path):
+        """(name, is_dir, is_file) for each entry of path"""
+        return tuple((name, *kind) for name, kind in self._entries(path).items())
+    
+    def exists(self, path):
+        parent, name = os.path.split(os.path.abspath(path))
+        return name in self._entries(parent)
+    
+    def is_dir(self, path):
+        parent, name = os.path.split(os.path.abspath(path))
+        return self._entries(parent).get(name, (False, False))[0]
+    
+    def forget(self, path):
+        """Drop the cached listing of path after changing its contents"""
+        self._listings.pop(os.path.abspath(path), None)
+
+def run_command(command, description, capture=False, env=None):
+    """Run a command and handle errors
+    
+    Output streams straight to the terminal unless capture=True, in which
+    case it is collected and printed once the command finishes.
+    """
     print(f"\n🔄 {description}")
     print(f"Running: {command}")
     
     try:
-        result = subprocess.run(command, shell=True, check=True, 
-                              capture_output=True, text=True)
+        result = subprocess.run(shlex.split(command), check=True, capture_output=capture, env=env)
         print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(f"Output: {result.stdout}")
+        if capture and result.stdout:
+            print(f"Output: {result.stdout.decode(errors='replace')}")
         return True
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed")
+        print(f"Error: {e}")
+        return False
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed")
-        print(f"Error: {e.stderr}")
+        if capture and e.stderr:
+            print(f"Error: {e.stderr.decode(errors='replace')}")
+        else:
+            print(f"Error: exit code {e.returncode}")
         return False
 
-def check_requirements():
+def check_requirements(stat_cache):
     """Check if all requirements are met"""
     print("🔍 Checking deployment requirements...")
     
@@ -38,8 +89,8 @@ def check_requirements():
     
     # Check if Docker is available
     try:
-        subprocess.run(["docker", "--version"], check=True, 
-                      capture_output=True, text=True)
+        subprocess.run(["docker", "--version"], check=True,
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         print("✅ Docker is available")
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("⚠️  Docker not found (optional for local deployment)")
@@ -52,8 +103,9 @@ def check_requirements():
         "docker-compose.yml"
     ]
     
+    # One readdir per parent directory instead of a stat per file
     for file_path in required_files:
-        if Path(file_path).exists():
+        if stat_cache.exists(file_path):
             print(f"✅ {file_path}")
         else:
             print(f"❌ Missing: {file_path}")
@@ -61,8 +113,26 @@ def check_requirements():
     
     return True
 
+DEPS_STAMP = Path(".aerocast_deps.stamp")
+
+def _deps_fingerprint():
+    """Hash of the interpreter and requirements.txt the install was done for"""
+    h = hashlib.sha256()
+    h.update(sys.executable.encode())
+    h.update(b"\0")
+    h.update(Path("requirements.txt").read_bytes())
+    return h.hexdigest()
+
 def install_dependencies():
-    """Install Python dependencies"""
+    """Install Python dependencies, skipped when nothing has changed"""
+    fingerprint = _deps_fingerprint()
+    try:
+        if DEPS_STAMP.read_text() == fingerprint:
+            print("\n✅ Dependencies up to date (cached)")
+            return True
+    except OSError:
+        pass
+    
     commands = [
         ("pip install --upgrade pip", "Upgrading pip"),
         ("pip install -r requirements.txt", "Installing Python dependencies")
@@ -71,9 +141,11 @@ def install_dependencies():
     for command, description in commands:
         if not run_command(command, description):
             return False
+    
+    DEPS_STAMP.write_text(fingerprint)
     return True
 
-def setup_directories():
+def setup_directories(stat_cache):
     """Create necessary directories"""
     directories = [
         "models",
@@ -84,8 +156,16 @@ def setup_directories():
     ]
     
     print("\n📁 Setting up directories...")
+    
+    # Skip directories that already exist, then create the rest concurrently
+    todo = [d for d in directories if not stat_cache.is_dir(d)]
+    
+    with ThreadPoolExecutor(max_workers=len(todo) or 1) as pool:
+        list(pool.map(lambda d: os.makedirs(d, exist_ok=True), todo))
+    if todo:
+        stat_cache.forget(".")
+    
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
         print(f"✅ Created/verified: {directory}")
 
 def deploy_local():
@@ -96,32 +176,56 @@ def deploy_local():
     os.environ["PYTHONPATH"] = str(Path.cwd())
     
     # Start the API server
-    command = "python -m uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload"
+    argv = [sys.executable, "-m", "uvicorn", "api.main:app",
+            "--host", "0.0.0.0", "--port", "8000", "--reload"]
     print(f"\n🌐 Starting API server...")
-    print(f"Command: {command}")
+    print(f"Command: {' '.join(argv)}")
     print(f"API will be available at: http://localhost:8000")
     print(f"Web interface: http://localhost:8000/static/index.html")
     print(f"API docs: http://localhost:8000/docs")
     print("\nPress Ctrl+C to stop the server")
     
+    if os.name == 'nt':
+        # Windows has no real exec; os.execv would detach from the console
+        try:
+            subprocess.run(argv, check=True)
+        except KeyboardInterrupt:
+            print("\n\n🛑 Server stopped by user")
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ Server failed to start: {e}")
+        return
+    
+    # Hand this process over to uvicorn; it owns signal handling from here
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(argv[0], argv)
+
+def _compose_command():
+    """'docker compose' when the v2 plugin is installed, else 'docker-compose'"""
     try:
-        subprocess.run(command, shell=True, check=True)
-    except KeyboardInterrupt:
-        print("\n\n🛑 Server stopped by user")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Server failed to start: {e}")
+        subprocess.run(["docker", "compose", "version"], check=True,
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return "docker compose"
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "docker-compose"
 
 def deploy_docker():
     """Deploy using Docker Compose"""
     print("\n🐳 Starting Docker deployment...")
     
+    # Compose v2 builds services concurrently by default; v1 needs --parallel
+    compose = _compose_command()
+    build_cmd = f"{compose} build" if compose == "docker compose" else f"{compose} build --parallel"
     commands = [
-        ("docker-compose build", "Building Docker images"),
-        ("docker-compose up -d", "Starting containers")
+        (build_cmd, "Building Docker images in parallel"),
+        (f"{compose} up -d", "Starting containers")
     ]
     
+    # BuildKit caches and builds independent stages concurrently
+    env = {**os.environ, "DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1"}
+    
     for command, description in commands:
-        if not run_command(command, description):
+        if not run_command(command, description, env=env):
             return False
     
     print("\n✅ Docker deployment completed!")
@@ -133,13 +237,33 @@ def deploy_docker():
     
     return True
 
+def wait_for_server(host, port, timeout=30.0):
+    """Poll /health with backoff until the server responds"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=0.5)
+            conn.request("GET", "/health")
+            response = conn.getresponse()
+            response.read()
+            conn.close()
+            if response.status < 500:
+                return True
+        except OSError:
+            pass
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, 1.0)
+    return False
+
 def run_tests():
     """Run basic tests"""
     print("\n🧪 Running tests...")
     
-    # Wait a moment for server to start
-    import time
-    time.sleep(3)
+    # Wait until the server answers instead of sleeping a fixed time
+    if not wait_for_server("localhost", 8000):
+        print("❌ Server did not become ready within 30s")
+        return False
     
     test_command = "python scripts/test_api.py"
     return run_command(test_command, "Running API tests")
@@ -158,13 +282,17 @@ def main():
     print("🚀 Air Quality Forecasting System Deployment")
     print("=" * 50)
     
+    # One cache for every path lookup in this run, warmed with the repo root
+    stat_cache = _StatCache()
+    stat_cache.listdir(".")
+    
     # Check requirements
-    if not check_requirements():
+    if not check_requirements(stat_cache):
         print("\n❌ Requirements check failed. Please fix the issues above.")
         sys.exit(1)
     
     # Setup directories
-    setup_directories()
+    setup_directories(stat_cache)
     
     # Install dependencies
     if not args.skip_deps:
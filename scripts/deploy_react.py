@@ -3,19 +3,40 @@
 Enhanced deployment script for React/Next.js frontend conversion
 """
 import os
+import select
 import sys
 import subprocess
 import time
 import json
+import shlex
+import shutil
 from pathlib import Path
 
+# Filesystem facts that do not change during a run, checked once at import
+HAS_PNPM_LOCK = Path("frontend/pnpm-lock.yaml").exists()
+VENV_DIR = next((Path(venv) for venv in ("venv", ".venv", "env") if Path(venv).exists()), None)
+if VENV_DIR is None:
+    VENV_PYTHON = "python"
+elif os.name == 'nt':  # Windows
+    VENV_PYTHON = f"{VENV_DIR}\\Scripts\\python"
+else:  # Unix/Linux/macOS
+    VENV_PYTHON = f"{VENV_DIR}/bin/python"
+
+# Touched in the venv after a successful pip install of requirements.txt
+PIP_MARKER = ".aerocast_last_pip_install"
+
+# Package manager chosen on first use, shared by install/build/start
+_PACKAGE_MANAGER = None
+
 def run_command(cmd, cwd=None, check=True):
     """Run a command and return the result"""
     print(f"🔧 Running: {cmd}")
+    argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    # No shell, so resolve Windows launchers such as npm.cmd ourselves
+    argv[0] = resolve_executable(argv[0])
     try:
         result = subprocess.run(
-            cmd, 
-            shell=True, 
+            argv,
             cwd=cwd, 
             check=check,
             capture_output=True,
@@ -31,115 +52,106 @@ def run_command(cmd, cwd=None, check=True):
             sys.exit(1)
         return e
 
+def resolve_executable(name):
+    """Full path to `name`, so launchers such as npm.cmd start without a shell"""
+    return shutil.which(name) or name
+
+def package_manager():
+    """pnpm when the frontend is locked with it and installed, npm otherwise"""
+    global _PACKAGE_MANAGER
+    if _PACKAGE_MANAGER is None:
+        if HAS_PNPM_LOCK and shutil.which("pnpm"):
+            _PACKAGE_MANAGER = "pnpm"
+        else:
+            _PACKAGE_MANAGER = "npm"
+    return _PACKAGE_MANAGER
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     print("🔍 Checking dependencies...")
     
-    # Check Node.js
-    try:
-        result = run_command("node --version", check=False)
-        if result.returncode == 0:
-            print(f"✅ Node.js: {result.stdout.strip()}")
-        else:
-            print("❌ Node.js not found. Please install Node.js 18+ from https://nodejs.org/")
-            return False
-    except:
+    # PATH lookups only; nothing is spawned unless a tool is actually present
+    available = {tool: shutil.which(tool) is not None for tool in ("node", "npm", "pnpm")}
+    
+    if not available["node"]:
         print("❌ Node.js not found. Please install Node.js 18+ from https://nodejs.org/")
         return False
+    print("✅ Node.js: found")
     
-    # Check npm/pnpm
-    npm_available = False
-    pnpm_available = False
-    
-    try:
-        result = run_command("npm --version", check=False)
-        if result.returncode == 0:
-            print(f"✅ npm: {result.stdout.strip()}")
-            npm_available = True
-    except:
-        pass
-    
-    try:
-        result = run_command("pnpm --version", check=False)
-        if result.returncode == 0:
-            print(f"✅ pnpm: {result.stdout.strip()}")
-            pnpm_available = True
-    except:
-        pass
-    
-    if not npm_available and not pnpm_available:
+    if not available["npm"] and not available["pnpm"]:
         print("❌ Neither npm nor pnpm found. Please install Node.js.")
         return False
     
+    manager = package_manager()
+    result = run_command(f"{manager} --version", check=False)
+    print(f"✅ {manager}: {result.stdout.strip()}")
+    
     return True
 
-def install_frontend_dependencies():
-    """Install frontend dependencies"""
-    print("📦 Installing frontend dependencies...")
-    
+def requirements_changed():
+    """Whether requirements.txt is newer than the last venv install"""
+    if VENV_DIR is None:
+        return True
+    marker = VENV_DIR / PIP_MARKER
+    try:
+        return marker.stat().st_mtime < Path("requirements.txt").stat().st_mtime
+    except FileNotFoundError:
+        return True
+
+def install_dependencies():
+    """Install frontend and Python dependencies concurrently"""
     frontend_dir = Path("frontend")
     if not frontend_dir.exists():
         print("❌ Frontend directory not found!")
         return False
     
-    # Check if pnpm is available and pnpm-lock.yaml exists
-    if Path("frontend/pnpm-lock.yaml").exists():
-        try:
-            run_command("pnpm --version", check=False)
-            print("🔧 Using pnpm for installation...")
-            run_command("pnpm install", cwd="frontend")
-            return True
-        except:
-            print("⚠️ pnpm not available, falling back to npm...")
+    # npm/pnpm and pip touch disjoint directories, so both installs run at once
+    manager = package_manager()
+    print(f"📦 Installing frontend dependencies with {manager}...")
+    try:
+        installs = {"Frontend": subprocess.Popen([resolve_executable(manager), "install"], cwd="frontend")}
+    except OSError as e:
+        print(f"❌ Could not run {manager}: {e}")
+        return False
     
-    # Use npm
-    print("🔧 Using npm for installation...")
-    run_command("npm install", cwd="frontend")
-    return True
+    if Path("requirements.txt").exists():
+        if requirements_changed():
+            print("📦 Installing Python dependencies...")
+            installs["Python"] = subprocess.Popen(
+                [VENV_PYTHON, "-m", "pip", "install", "-r", "requirements.txt"]
+            )
+        else:
+            print("✅ Python dependencies up to date")
+    
+    ok = True
+    for name, process in installs.items():
+        if process.wait() != 0:
+            print(f"❌ {name} dependency installation failed (exit code {process.returncode})")
+            ok = False
+        elif name == "Python" and VENV_DIR is not None:
+            (VENV_DIR / PIP_MARKER).touch()
+    
+    return ok
 
 def build_frontend():
     """Build the React/Next.js frontend"""
     print("🏗️ Building React/Next.js frontend...")
     
-    # Check if pnpm is available
-    try:
-        run_command("pnpm --version", check=False)
-        if Path("frontend/pnpm-lock.yaml").exists():
-            run_command("pnpm run build", cwd="frontend")
-            return True
-    except:
-        pass
-    
-    # Use npm
-    run_command("npm run build", cwd="frontend")
+    run_command(f"{package_manager()} run build", cwd="frontend")
     return True
 
 def start_backend():
     """Start the FastAPI backend"""
     print("🚀 Starting FastAPI backend...")
     
-    # Check if virtual environment exists
-    venv_paths = ["venv", ".venv", "env"]
-    python_cmd = "python"
-    
-    for venv_path in venv_paths:
-        if Path(venv_path).exists():
-            if os.name == 'nt':  # Windows
-                python_cmd = f"{venv_path}\\Scripts\\python"
-            else:  # Unix/Linux/macOS
-                python_cmd = f"{venv_path}/bin/python"
-            break
-    
-    # Install Python dependencies if requirements.txt exists
-    if Path("requirements.txt").exists():
-        print("📦 Installing Python dependencies...")
-        run_command(f"{python_cmd} -m pip install -r requirements.txt")
-    
     # Start the backend server
     print("🌐 Starting backend server on http://localhost:8000...")
     backend_process = subprocess.Popen([
-        python_cmd, "-m", "uvicorn", "api.main:app", 
-        "--host", "0.0.0.0", "--port", "8000", "--reload"
+        VENV_PYTHON, "-m", "uvicorn", "api.main:app", 
+        "--host", "0.0.0.0", "--port", "8000",
+        # Only app code triggers a reload; model weights never do
+        "--reload", "--reload-dir", "api", "--reload-dir", "src",
+        "--reload-exclude", "*.h5", "--reload-exclude", "*.pkl",
     ])
     
     return backend_process
@@ -148,26 +160,52 @@ def start_frontend():
     """Start the React/Next.js frontend"""
     print("🚀 Starting React/Next.js frontend...")
     
-    # Check if pnpm is available
-    try:
-        run_command("pnpm --version", check=False)
-        if Path("frontend/pnpm-lock.yaml").exists():
-            print("🌐 Starting frontend server on http://localhost:3000...")
-            frontend_process = subprocess.Popen([
-                "pnpm", "run", "dev"
-            ], cwd="frontend")
-            return frontend_process
-    except:
-        pass
-    
-    # Use npm
     print("🌐 Starting frontend server on http://localhost:3000...")
-    frontend_process = subprocess.Popen([
-        "npm", "run", "dev"
-    ], cwd="frontend")
+    manager = package_manager()
+    try:
+        frontend_process = subprocess.Popen([
+            resolve_executable(manager), "run", "dev"
+        ], cwd="frontend")
+    except OSError as e:
+        print(f"❌ Could not run {manager}: {e}")
+        return None
     
     return frontend_process
 
+def wait_for_exit(processes):
+    """Block until one of `processes` exits and return its name
+    
+    On Linux each child is watched through a pidfd, so the wait costs no CPU
+    and a crash is noticed immediately; elsewhere the children are polled.
+    """
+    pidfds = {}
+    if hasattr(os, "pidfd_open"):
+        try:
+            for name, process in processes.items():
+                pidfds[os.pidfd_open(process.pid)] = name
+        except OSError:
+            for fd in pidfds:
+                os.close(fd)
+            pidfds = {}
+    
+    try:
+        if pidfds:
+            poller = select.poll()
+            for fd in pidfds:
+                poller.register(fd, select.POLLIN)
+            # A readable pidfd means that process has exited
+            fd, _ = poller.poll()[0]
+            return pidfds[fd]
+        
+        while True:
+            for name, process in processes.items():
+                if process.poll() is not None:
+                    return name
+            time.sleep(1)
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
 def create_proxy_config():
     """Create a simple proxy configuration for development"""
     proxy_config = {
@@ -246,9 +284,9 @@ def main():
         print("❌ Dependency check failed!")
         sys.exit(1)
     
-    # Install frontend dependencies
-    if not install_frontend_dependencies():
-        print("❌ Frontend dependency installation failed!")
+    # Install frontend and backend dependencies
+    if not install_dependencies():
+        print("❌ Dependency installation failed!")
         sys.exit(1)
     
     # Build frontend
@@ -271,32 +309,43 @@ def main():
     
     # Start frontend
     frontend_process = start_frontend()
+    if frontend_process is None:
+        backend_process.terminate()
+        sys.exit(1)
     time.sleep(2)  # Give frontend time to start
     
-    print("\n✅ Deployment completed successfully!")
-    print("=" * 50)
-    print("🌐 Access your application:")
-    print("   • Frontend (React/Next.js): http://localhost:3000")
-    print("   • Backend API: http://localhost:8000")
-    print("   • API Documentation: http://localhost:8000/docs")
-    print("   • Health Check: http://localhost:8000/health")
-    print("\n📊 Available Pages:")
-    print("   • Dashboard: http://localhost:3000/")
-    print("   • Historical: http://localhost:3000/historical")
-    print("   • Analytics: http://localhost:3000/analytics")
-    print("   • Settings: http://localhost:3000/settings")
-    print("\n🎉 Your React/Next.js conversion is ready!")
-    print("Press Ctrl+C to stop all services")
-    
+    sys.stdout.write(
+        "\n✅ Deployment completed successfully!\n"
+        f"{'=' * 50}\n"
+        "🌐 Access your application:\n"
+        "   • Frontend (React/Next.js): http://localhost:3000\n"
+        "   • Backend API: http://localhost:8000\n"
+        "   • API Documentation: http://localhost:8000/docs\n"
+        "   • Health Check: http://localhost:8000/health\n"
+        "\n📊 Available Pages:\n"
+        "   • Dashboard: http://localhost:3000/\n"
+        "   • Historical: http://localhost:3000/historical\n"
+        "   • Analytics: http://localhost:3000/analytics\n"
+        "   • Settings: http://localhost:3000/settings\n"
+        "\n🎉 Your React/Next.js conversion is ready!\n"
+        "Press Ctrl+C to stop all services\n"
+    )
+    sys.stdout.flush()
+    
+    processes = {"backend": backend_process, "frontend": frontend_process}
     try:
-        # Keep the script running
-        while True:
-            time.sleep(1)
+        name = wait_for_exit(processes)
+        process = processes.pop(name)
+        print(f"\n❌ {name} process died with code {process.wait()}")
+        print("🛑 Stopping remaining services...")
     except KeyboardInterrupt:
         print("\n🛑 Stopping services...")
-        backend_process.terminate()
-        frontend_process.terminate()
-        print("✅ All services stopped. Goodbye!")
+    
+    for process in processes.values():
+        process.terminate()
+    for process in processes.values():
+        process.wait()
+    print("✅ All services stopped. Goodbye!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
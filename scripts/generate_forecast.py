@@ -2,13 +2,24 @@
 """
 Batch forecast generation script
 """
+import os
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import orjson
+import pyarrow as pa
+import xarray as xr
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -20,8 +31,98 @@ from config.settings import settings
 setup_logging()
 logger = get_logger(__name__)
 
-def generate_grid_forecast(output_file: str = None, hours: int = 24):
-    """Generate forecast for a grid of locations in Delhi NCR"""
+# Grid points handed to the model per predict_batch call
+BATCH_SIZE = 1024
+
+# Concurrent predict calls; the model already parallelises within a batch
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# On-disk memo of model calls, reused across runs (needs joblib)
+CACHE_DIR = Path(".cache/forecast")
+
+def model_version() -> str:
+    """Identifies the loaded model so cached predictions from another one are not reused"""
+    if 'basic_enhanced' in model_service.models:
+        stat = Path("models/basic_enhanced_lstm.h5").stat()
+        return f"basic_enhanced_{stat.st_size}_{stat.st_mtime_ns}"
+    return "fast_atmospheric_patterns"
+
+def _predict_point(lat: float, lon: float, hours: int, version: str, issued: str) -> dict:
+    """model_service.predict; `version` and `issued` only key the cache"""
+    return model_service.predict(lat, lon, hours, include_uncertainty=True)
+
+def _predict_points(lats: np.ndarray, lons: np.ndarray, hours: int, version: str, issued: str) -> dict:
+    """model_service.predict_batch; `version` and `issued` only key the cache"""
+    return model_service.predict_batch(lats, lons, hours)
+
+def cached(func, use_cache: bool = True):
+    """`func` bound to the current model and issue hour, memoized on disk
+    
+    Forecasts depend on the hour they are issued, so the UTC hour is part of
+    the key along with the model version; a rerun within the hour is served
+    from CACHE_DIR instead of the model.
+    """
+    if use_cache and joblib is not None:
+        func = joblib.Memory(CACHE_DIR, verbose=0).cache(func)
+    version, issued = model_version(), datetime.utcnow().strftime("%Y%m%d%H")
+    return lambda *args: func(*args, version, issued)
+
+def write_json(output_path: Path, forecasts: list):
+    """Serialize forecasts with orjson, which encodes numpy arrays natively"""
+    output_path.write_bytes(orjson.dumps(forecasts, option=orjson.OPT_SERIALIZE_NUMPY))
+
+@contextmanager
+def json_array_writer(output_path: Path):
+    """Yield a function that appends one record to a JSON array file"""
+    with open(output_path, 'wb') as f:
+        separator = b"["
+        
+        def write_record(record):
+            nonlocal separator
+            f.write(separator)
+            f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY))
+            separator = b",\n"
+        
+        yield write_record
+        f.write(b"[]\n" if separator == b"[" else b"]\n")
+
+def grid_frame(lats: np.ndarray, lons: np.ndarray, preds: np.ndarray, pollutants: list,
+               forecast_time: str, model_used: np.ndarray) -> pd.DataFrame:
+    """Long (point, hour, pollutant) table from the SoA grid arrays"""
+    n_points, steps, n_pollutants = preds.shape
+    per_point = steps * n_pollutants
+    return pd.DataFrame({
+        'latitude': np.repeat(lats, per_point),
+        'longitude': np.repeat(lons, per_point),
+        'hour': np.tile(np.repeat(np.arange(steps, dtype=np.int16), n_pollutants), n_points),
+        'pollutant': pd.Categorical.from_codes(np.tile(np.arange(n_pollutants), n_points * steps), pollutants),
+        'value': preds.ravel(),
+        'forecast_time': pd.Categorical.from_codes(np.zeros(n_points * per_point, dtype=np.int8), [forecast_time]),
+        'model_used': pd.Categorical(np.repeat(model_used, per_point)),
+    })
+
+def grid_dataset(lats: np.ndarray, lons: np.ndarray, preds: np.ndarray, pollutants: list,
+                 forecast_time: str, model_used: np.ndarray) -> xr.Dataset:
+    """(latitude, longitude, hour) cube per pollutant from the SoA grid arrays"""
+    shape = (len(lats), len(lons))
+    steps = preds.shape[1]
+    data_vars = {
+        pollutant: (('latitude', 'longitude', 'hour'), preds[..., i].reshape(shape + (steps,)))
+        for i, pollutant in enumerate(pollutants)
+    }
+    data_vars['model_used'] = (('latitude', 'longitude'), model_used.astype(str).reshape(shape))
+    return xr.Dataset(data_vars, coords={'latitude': lats, 'longitude': lons, 'hour': np.arange(steps)},
+                      attrs={'forecast_time': forecast_time})
+
+def generate_grid_forecast(output_file: str = None, hours: int = 24, fmt: str = "parquet",
+                           use_cache: bool = True):
+    """Generate forecast for a grid of locations in Delhi NCR
+    
+    `fmt` is "json" (one nested record per point), "parquet"/"feather" (a
+    zstd-compressed long table with one row per point, hour and pollutant),
+    "arrow" (the same table as an uncompressed Arrow IPC file, memory-mappable
+    by readers) or "netcdf" (a latitude x longitude x hour cube per pollutant).
+    """
     
     # Define grid bounds for Delhi NCR
     lat_min, lat_max = settings.DELHI_BBOX_MIN_LAT, settings.DELHI_BBOX_MAX_LAT
@@ -32,93 +133,152 @@ def generate_grid_forecast(output_file: str = None, hours: int = 24):
     lats = np.arange(lat_min, lat_max + resolution, resolution)
     lons = np.arange(lon_min, lon_max + resolution, resolution)
     
-    logger.info(f"Generating forecast for {len(lats)}x{len(lons)} grid ({len(lats)*len(lons)} points)")
+    # Both coordinate planes live in one (2, lat, lon) buffer filled by
+    # broadcasting; reshaping yields contiguous flat views without copies
+    grid = np.empty((2, len(lats), len(lons)))
+    grid[0] = lats[:, np.newaxis]
+    grid[1] = lons
+    lat_flat, lon_flat = grid.reshape(2, -1)
+    total_points = lat_flat.size
     
-    forecasts = []
-    total_points = len(lats) * len(lons)
+    logger.info(f"Generating forecast for {len(lats)}x{len(lons)} grid ({total_points} points)")
     
-    for i, lat in enumerate(lats):
-        for j, lon in enumerate(lons):
-            point_idx = i * len(lons) + j + 1
-            
-            if point_idx % 100 == 0:
-                logger.info(f"Processing point {point_idx}/{total_points}")
-            
-            try:
-                # Get prediction for this location
-                result = model_service.predict(lat, lon, hours, include_uncertainty=False)
-                
-                forecast_data = {
-                    'latitude': lat,
-                    'longitude': lon,
-                    'forecast_time': datetime.utcnow().isoformat(),
-                    'forecast_horizon_hours': hours,
-                    'model_used': result.get('model_used', 'unknown'),
-                    'predictions': result['predictions']
-                }
-                
-                forecasts.append(forecast_data)
-                
-            except Exception as e:
-                logger.error(f"Error generating forecast for ({lat}, {lon}): {e}")
-                continue
+    # One issue time for the whole run
+    issued = datetime.utcnow()
+    forecast_time = issued.isoformat()
     
-    # Save results
     if output_file is None:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        output_file = f"forecasts/grid_forecast_{timestamp}.json"
+        timestamp = issued.strftime("%Y%m%d_%H%M%S")
+        output_file = f"forecasts/grid_forecast_{timestamp}.{'nc' if fmt == 'netcdf' else fmt}"
     
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(forecasts, f, indent=2)
+    # Columnar formats collect results structure-of-arrays style: per-point
+    # metadata vectors plus one (point, hour, pollutant) float32 buffer that
+    # each batch fills in place
+    pollutants, preds = [], np.empty((total_points, 0, 0), dtype=np.float32)
+    predicted = np.zeros(total_points, dtype=bool)
+    models_used = np.empty(total_points, dtype=object)
+    saved_points = 0
     
-    logger.info(f"Saved {len(forecasts)} forecasts to {output_path}")
+    predict_points = cached(_predict_points, use_cache)
+    
+    def predict(start):
+        stop = min(start + BATCH_SIZE, total_points)
+        try:
+            return predict_points(lat_flat[start:stop], lon_flat[start:stop], hours)
+        except Exception as e:
+            logger.error(f"Error generating forecast for points {start + 1}-{stop}: {e}")
+            return None
+    
+    # JSON records are written out as each batch completes rather than held
+    # in memory; workers predict upcoming batches meanwhile
+    starts = range(0, total_points, BATCH_SIZE)
+    json_output = json_array_writer(output_path) if fmt == "json" else nullcontext()
+    with json_output as write_record, ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for start, result in zip(starts, pool.map(predict, starts)):
+            stop = min(start + BATCH_SIZE, total_points)
+            batch_lats, batch_lons = lat_flat[start:stop], lon_flat[start:stop]
+            if result is None:
+                continue
+            
+            model_used = result.get('model_used', 'unknown')
+            if fmt == "json":
+                # Contiguous rows let orjson write each series straight from the buffer
+                predictions = {pollutant: np.ascontiguousarray(values) for pollutant, values in result['predictions'].items()}
+                for k, (lat, lon) in enumerate(zip(batch_lats.tolist(), batch_lons.tolist())):
+                    write_record({
+                        'latitude': lat,
+                        'longitude': lon,
+                        'forecast_time': forecast_time,
+                        'forecast_horizon_hours': hours,
+                        'model_used': model_used,
+                        'predictions': {pollutant: values[k] for pollutant, values in predictions.items()}
+                    })
+            else:
+                if not pollutants:
+                    pollutants = list(result['predictions'])
+                    steps = next(iter(result['predictions'].values())).shape[1]
+                    preds = np.full((total_points, steps, len(pollutants)), np.nan, dtype=np.float32)
+                try:
+                    for i, pollutant in enumerate(pollutants):
+                        preds[start:stop, :, i] = result['predictions'][pollutant]
+                except (KeyError, ValueError) as e:
+                    logger.error(f"Inconsistent forecast for points {start + 1}-{stop}: {e}")
+                    continue
+                predicted[start:stop] = True
+                models_used[start:stop] = model_used
+            saved_points += stop - start
+            
+            # loguru formats the arguments only if a sink accepts INFO
+            logger.info("Processed points {}/{}", stop, total_points)
+    
+    if fmt == "netcdf":
+        grid_dataset(lats, lons, preds, pollutants, forecast_time, models_used).to_netcdf(output_path)
+    elif fmt != "json":
+        frame = grid_frame(lat_flat[predicted], lon_flat[predicted], preds[predicted], pollutants,
+                           forecast_time, models_used[predicted])
+        if fmt == "parquet":
+            frame.to_parquet(output_path, compression='zstd', index=False)
+        elif fmt == "arrow":
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            with pa.OSFile(str(output_path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            frame.to_feather(output_path, compression='zstd')
+    
+    logger.info(f"Saved {saved_points} forecasts to {output_path}")
     return output_path
 
-def generate_location_forecast(locations: list, output_file: str = None, hours: int = 24):
+def _predict_location(location: dict, hours: int, predict_point, forecast_time: str):
+    """Forecast record for one location, or None if prediction fails"""
+    lat = location['latitude']
+    lon = location['longitude']
+    name = location.get('name', f"Location_{lat}_{lon}")
+    
+    logger.info("Generating forecast for {} ({}, {})", name, lat, lon)
+    
+    try:
+        result = predict_point(round(lat, 3), round(lon, 3), hours)
+    except Exception as e:
+        logger.error(f"Error generating forecast for {name}: {e}")
+        return None
+    
+    return {
+        'name': name,
+        'latitude': lat,
+        'longitude': lon,
+        'forecast_time': forecast_time,
+        'forecast_horizon_hours': hours,
+        'model_used': result.get('model_used', 'unknown'),
+        'predictions': result['predictions'],
+        'uncertainties': result.get('uncertainties', {})
+    }
+
+def generate_location_forecast(locations: list, output_file: str = None, hours: int = 24,
+                               use_cache: bool = True):
     """Generate forecast for specific locations"""
     
-    forecasts = []
+    predict_point = cached(_predict_point, use_cache)
+    issued = datetime.utcnow()
+    forecast_time = issued.isoformat()
     
-    for location in locations:
-        lat = location['latitude']
-        lon = location['longitude']
-        name = location.get('name', f"Location_{lat}_{lon}")
-        
-        logger.info(f"Generating forecast for {name} ({lat}, {lon})")
-        
-        try:
-            result = model_service.predict(lat, lon, hours, include_uncertainty=True)
-            
-            forecast_data = {
-                'name': name,
-                'latitude': lat,
-                'longitude': lon,
-                'forecast_time': datetime.utcnow().isoformat(),
-                'forecast_horizon_hours': hours,
-                'model_used': result.get('model_used', 'unknown'),
-                'predictions': result['predictions'],
-                'uncertainties': result.get('uncertainties', {})
-            }
-            
-            forecasts.append(forecast_data)
-            
-        except Exception as e:
-            logger.error(f"Error generating forecast for {name}: {e}")
-            continue
+    # Each prediction is independent, so run them across a thread pool;
+    # map() keeps the output in input order
+    with ThreadPoolExecutor(max_workers=max(1, min(len(locations), MAX_WORKERS))) as pool:
+        results = pool.map(lambda location: _predict_location(location, hours, predict_point, forecast_time), locations)
+        forecasts = [forecast for forecast in results if forecast is not None]
     
     # Save results
     if output_file is None:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = issued.strftime("%Y%m%d_%H%M%S")
         output_file = f"forecasts/location_forecast_{timestamp}.json"
     
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(forecasts, f, indent=2)
+    write_json(output_path, forecasts)
     
     logger.info(f"Saved {len(forecasts)} forecasts to {output_path}")
     return output_path
@@ -133,13 +293,17 @@ def main():
                        help="Output file path")
     parser.add_argument("--locations-file", type=str,
                        help="JSON file with locations to forecast")
+    parser.add_argument("--format", choices=["json", "parquet", "feather", "arrow", "netcdf"], default="parquet",
+                       help="Grid output format (grid mode only)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help=f"Always run the model instead of reusing predictions from {CACHE_DIR}")
     
     args = parser.parse_args()
     
     logger.info(f"Starting forecast generation in {args.mode} mode")
     
     if args.mode == "grid":
-        output_path = generate_grid_forecast(args.output, args.hours)
+        output_path = generate_grid_forecast(args.output, args.hours, args.format, not args.no_cache)
         
     elif args.mode == "locations":
         # Default locations if no file provided
@@ -158,7 +322,7 @@ def main():
                 {"name": "Karol Bagh", "latitude": 28.6519, "longitude": 77.1909}
             ]
         
-        output_path = generate_location_forecast(locations, args.output, args.hours)
+        output_path = generate_location_forecast(locations, args.output, args.hours, not args.no_cache)
     
     logger.info(f"Forecast generation completed. Output saved to: {output_path}")
 
@@ -5,13 +5,39 @@ Minimal server that definitely works
 
 import os
 import sys
+import json
 import subprocess
 import time
 import webbrowser
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import threading
 
+# Dummy forecast returned for every /api/ request, encoded once at import
+_DUMMY_DATA = {
+    "location": {"latitude": 28.6139, "longitude": 77.2090, "city": "Delhi"},
+    "forecast_time": "2025-10-14T12:00:00",
+    "forecast_horizon": 24,
+    "forecasts": [
+        {
+            "pollutant": "NO2_forecast",
+            "values": [58, 62, 45, 38, 72, 68, 55, 42, 48, 52, 59, 63, 47, 41, 75, 71, 58, 45, 51, 55, 61, 65, 49, 43],
+            "unit": "µg/m³"
+        },
+        {
+            "pollutant": "O3_forecast", 
+            "values": [32, 28, 35, 42, 38, 45, 52, 35, 30, 34, 31, 38, 45, 41, 48, 55, 38, 33, 37, 40, 36, 43, 50, 36],
+            "unit": "µg/m³"
+        }
+    ],
+    "metadata": {
+        "model_version": "v1.0",
+        "model_used": "demo_atmospheric_patterns"
+    }
+}
+_DUMMY_JSON_BYTES = json.dumps(_DUMMY_DATA).encode()
+_CONTENT_LENGTH = str(len(_DUMMY_JSON_BYTES))
+
 class CustomHandler(SimpleHTTPRequestHandler):
     """Custom handler for serving files"""
     
@@ -26,34 +52,11 @@ class CustomHandler(SimpleHTTPRequestHandler):
             # Handle API requests with dummy data
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', _CONTENT_LENGTH)
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
             
-            # Return dummy forecast data
-            dummy_data = {
-                "location": {"latitude": 28.6139, "longitude": 77.2090, "city": "Delhi"},
-                "forecast_time": "2025-10-14T12:00:00",
-                "forecast_horizon": 24,
-                "forecasts": [
-                    {
-                        "pollutant": "NO2_forecast",
-                        "values": [58, 62, 45, 38, 72, 68, 55, 42, 48, 52, 59, 63, 47, 41, 75, 71, 58, 45, 51, 55, 61, 65, 49, 43],
-                        "unit": "µg/m³"
-                    },
-                    {
-                        "pollutant": "O3_forecast", 
-                        "values": [32, 28, 35, 42, 38, 45, 52, 35, 30, 34, 31, 38, 45, 41, 48, 55, 38, 33, 37, 40, 36, 43, 50, 36],
-                        "unit": "µg/m³"
-                    }
-                ],
-                "metadata": {
-                    "model_version": "v1.0",
-                    "model_used": "demo_atmospheric_patterns"
-                }
-            }
-            
-            import json
-            self.wfile.write(json.dumps(dummy_data).encode())
+            self.wfile.write(_DUMMY_JSON_BYTES)
             return
         
         return super().do_GET()
@@ -85,7 +88,8 @@ def start_minimal_server():
     server_address = ('', port)
     
     try:
-        httpd = HTTPServer(server_address, CustomHandler)
+        # One thread per connection so a slow client cannot stall the rest
+        httpd = ThreadingHTTPServer(server_address, CustomHandler)
         
         print(f"🚀 Server starting on port {port}...")
         print(f"🌐 Your website will be available at:")
@@ -4,16 +4,25 @@ Monitoring script for the air quality forecasting system
 """
 import requests
 import time
-import json
+import orjson
 from datetime import datetime
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One keep-alive session for every probe, so repeated checks skip the handshake
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 def check_api_health(base_url="http://localhost:8000"):
     """Check if API is healthy"""
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
-        return response.status_code == 200, response.json()
+        response = SESSION.get(f"{base_url}/health", timeout=5)
+        return response.status_code == 200, orjson.loads(response.content)
     except Exception as e:
         return False, {"error": str(e)}
 
@@ -28,11 +37,11 @@ def check_prediction_accuracy(base_url="http://localhost:8000"):
         }
         
         start_time = time.time()
-        response = requests.post(f"{base_url}/api/v1/predict", json=payload, timeout=10)
+        response = SESSION.post(f"{base_url}/api/v1/predict", json=payload, timeout=10)
         response_time = time.time() - start_time
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             return True, {
                 "response_time": response_time,
                 "forecasts_count": len(data.get("forecasts", [])),
@@ -58,6 +67,7 @@ def monitor_system(base_url="http://localhost:8000", interval=60, duration=None)
     health_failures = 0
     prediction_failures = 0
     
+    pool = ThreadPoolExecutor(max_workers=2)
     try:
         while True:
             check_count += 1
@@ -65,8 +75,12 @@ def monitor_system(base_url="http://localhost:8000", interval=60, duration=None)
             
             print(f"\n[{current_time}] Check #{check_count}")
             
+            # Both probes run at once; a slow prediction no longer delays the health check
+            health_future = pool.submit(check_api_health, base_url)
+            pred_future = pool.submit(check_prediction_accuracy, base_url)
+            
             # Health check
-            health_ok, health_data = check_api_health(base_url)
+            health_ok, health_data = health_future.result()
             if health_ok:
                 print("   ✅ Health check: OK")
                 print(f"      Status: {health_data.get('status', 'unknown')}")
@@ -77,7 +91,7 @@ def monitor_system(base_url="http://localhost:8000", interval=60, duration=None)
                 print(f"      Error: {health_data.get('error', 'unknown')}")
             
             # Prediction check
-            pred_ok, pred_data = check_prediction_accuracy(base_url)
+            pred_ok, pred_data = pred_future.result()
             if pred_ok:
                 print("   ✅ Prediction test: OK")
                 print(f"      Response time: {pred_data.get('response_time', 0):.2f}s")
@@ -101,6 +115,8 @@ def monitor_system(base_url="http://localhost:8000", interval=60, duration=None)
             
     except KeyboardInterrupt:
         print("\n\n🛑 Monitoring stopped by user")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
     
     # Final summary
     total_time = time.time() - start_time
@@ -134,9 +150,9 @@ def run_single_check(base_url="http://localhost:8000"):
     # Model info check
     print("\n2. Model Information")
     try:
-        response = requests.get(f"{base_url}/api/v1/model-info", timeout=5)
+        response = SESSION.get(f"{base_url}/api/v1/model-info", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("   ✅ Model info retrieved")
             print(f"      Version: {data.get('model_version')}")
             print(f"      Variables: {data.get('target_variables')}")
@@ -161,9 +177,9 @@ def run_single_check(base_url="http://localhost:8000"):
     # Locations check
     print("\n4. Available Locations")
     try:
-        response = requests.get(f"{base_url}/api/v1/locations", timeout=5)
+        response = SESSION.get(f"{base_url}/api/v1/locations", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ {data.get('total_count', 0)} locations available")
         else:
             print(f"   ⚠️  Locations check failed: {response.status_code}")
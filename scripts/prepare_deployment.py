@@ -5,6 +5,7 @@ Prepare the project for deployment on Vercel (frontend) and Render (backend)
 import os
 import json
 import subprocess
+from copy import deepcopy
 from pathlib import Path
 
 def create_git_repository():
@@ -13,7 +14,7 @@ def create_git_repository():
     
     # Initialize git if not already done
     if not Path(".git").exists():
-        subprocess.run(["git", "init"], check=True)
+        subprocess.run(["git", "init"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         print("✅ Git repository initialized")
     
     # Create .gitignore if it doesn't exist
@@ -119,22 +120,23 @@ def update_frontend_config():
     
     # Update package.json scripts
     package_json_path = Path("frontend/package.json")
-    with open(package_json_path, "r") as f:
-        package_data = json.load(f)
+    original = json.loads(package_json_path.read_text())
+    package_data = deepcopy(original)
     
     # Ensure build script exists
-    if "scripts" not in package_data:
-        package_data["scripts"] = {}
-    
-    package_data["scripts"].update({
+    package_data.setdefault("scripts", {}).update({
         "build": "next build",
         "start": "next start",
         "dev": "next dev",
         "lint": "next lint"
     })
     
-    with open(package_json_path, "w") as f:
-        json.dump(package_data, f, indent=2)
+    # Leave the file alone when nothing changed so dev-server watchers stay quiet
+    if package_data == original:
+        print("✅ Frontend configuration already up to date")
+        return
+    
+    package_json_path.write_text(json.dumps(package_data, indent=2))
     
     print("✅ Frontend configuration updated")
 
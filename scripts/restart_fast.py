@@ -3,13 +3,30 @@
 Restart server with fast predictions
 """
 
+import argparse
 import subprocess
 import sys
 import time
 import os
 
-def restart_fast_server():
-    """Restart with fast predictions"""
+from _procutil import kill_port
+from _server_launcher import PROJECT_ROOT, RELOAD_ARGS
+
+sys.path.append(str(PROJECT_ROOT))
+from config.settings import settings
+
+def kill_server(port):
+    """Terminate whatever is listening on `port` and wait for it to exit"""
+    try:
+        _, failed = kill_port(port)
+    except Exception as e:
+        print(f"⚠️  Error cleaning port {port}: {e}")
+        return
+    for pid in failed:
+        print(f"⚠️  Could not stop process {pid} on port {port}")
+
+def restart_fast_server(dev=False):
+    """Restart with fast predictions; `dev` serves a single auto-reloading process"""
     print("""
 ⚡ RESTARTING WITH INSTANT PREDICTIONS!
 
@@ -22,12 +39,8 @@ def restart_fast_server():
 Restarting server...
     """)
     
-    # Kill existing processes
-    try:
-        subprocess.run('taskkill /F /IM python.exe', shell=True, capture_output=True)
-        time.sleep(2)
-    except:
-        pass
+    # Stop only the server bound to the port, not every Python process
+    kill_server(8000)
     
     # Start fast server
     try:
@@ -36,11 +49,17 @@ Restarting server...
             "api.main:app", 
             "--host", "127.0.0.1",
             "--port", "8000",
-            "--reload"
+            "--loop", settings.SERVER_LOOP,
+            "--http", settings.SERVER_HTTP,
         ]
+        if dev:
+            cmd += RELOAD_ARGS
+        else:
+            # No file watcher, one process per worker
+            cmd += ["--workers", str(settings.WORKERS)]
         
         print("🚀 Starting FAST server...")
-        process = subprocess.Popen(cmd)
+        process = subprocess.Popen(cmd, cwd=PROJECT_ROOT)
         
         time.sleep(3)
         
@@ -68,4 +87,8 @@ Restarting server...
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    restart_fast_server()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Restart the API server")
+    parser.add_argument("--dev", action="store_true", help="Auto-reload on code changes (single process)")
+    args = parser.parse_args()
+    
+    restart_fast_server(dev=args.dev)
\ No newline at end of file
@@ -3,10 +3,46 @@
 Setup script to use one of your existing trained models for real predictions
 """
 
+import json
 import os
-import shutil
 from pathlib import Path
 
+from _fileutil import fastcopy
+
+# Latest model lookup, keyed by the models/ directory mtime
+DISCOVERY_CACHE = Path(__file__).parent / ".setup_real_model.cache.json"
+
+def _scan_latest_model(models_dir):
+    """(latest model directory, its .h5 file or None) from a full scan of models/"""
+    model_dirs = [d for d in models_dir.iterdir() if d.is_dir() and d.name != '.git']
+    if not model_dirs:
+        return None, None
+    
+    # Sort by creation time and get the most recent
+    latest_model_dir = max(model_dirs, key=lambda x: x.stat().st_mtime)
+    model_files = list(latest_model_dir.glob("*.h5"))
+    return latest_model_dir, model_files[0] if model_files else None
+
+def find_latest_model(models_dir):
+    """_scan_latest_model, rescanning only when models/ has changed since the last run"""
+    key = {'models_dir': str(models_dir.resolve()), 'models_mtime_ns': models_dir.stat().st_mtime_ns}
+    try:
+        cached = json.loads(DISCOVERY_CACHE.read_text())
+        if all(cached.get(k) == v for k, v in key.items()) and Path(cached['latest_h5']).is_file():
+            return Path(cached['latest_dir']), Path(cached['latest_h5'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    latest_model_dir, model_file = _scan_latest_model(models_dir)
+    if model_file is not None:
+        try:
+            tmp_path = DISCOVERY_CACHE.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({**key, 'latest_dir': str(latest_model_dir), 'latest_h5': str(model_file)}))
+            os.replace(tmp_path, DISCOVERY_CACHE)
+        except OSError:
+            pass
+    return latest_model_dir, model_file
+
 def setup_real_model():
     """Copy one of the existing trained models to the expected location"""
     
@@ -21,32 +57,25 @@ def setup_real_model():
     models_dir = Path("models")
     
     # Find the most recent model
-    model_dirs = [d for d in models_dir.iterdir() if d.is_dir() and d.name != '.git']
+    latest_model_dir, model_file = find_latest_model(models_dir)
     
-    if not model_dirs:
+    if latest_model_dir is None:
         print("❌ No trained models found!")
         return False
     
-    # Sort by creation time and get the most recent
-    latest_model_dir = max(model_dirs, key=lambda x: x.stat().st_mtime)
-    
     print(f"📁 Found latest model: {latest_model_dir.name}")
     
-    # Check what files are in the model directory
-    model_files = list(latest_model_dir.glob("*.h5"))
-    
-    if not model_files:
+    if model_file is None:
         print(f"❌ No .h5 model files found in {latest_model_dir}")
         return False
     
-    model_file = model_files[0]
     print(f"🧠 Using model file: {model_file.name}")
     
     # Copy to expected location
     target_model = models_dir / "basic_enhanced_lstm.h5"
     
     try:
-        shutil.copy2(model_file, target_model)
+        fastcopy(model_file, target_model)
         print(f"✅ Copied model to: {target_model}")
         
         # Create dummy scaler and feature engineer files
@@ -10,38 +10,20 @@ import time
 import webbrowser
 from pathlib import Path
 
+from _procutil import kill_port
+
 def kill_existing_processes():
     """Kill any existing processes on port 8000"""
     try:
         # Find and kill processes on port 8000
-        result = subprocess.run(
-            'netstat -ano | findstr :8000',
-            shell=True,
-            capture_output=True,
-            text=True
-        )
+        stopped, failed = kill_port(8000)
+        for pid in stopped:
+            print(f"✅ Stopped existing process {pid}")
+        for pid in failed:
+            print(f"⚠️  Could not stop process {pid} on port 8000")
         
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            pids = set()
-            
-            for line in lines:
-                if 'LISTENING' in line:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        pids.add(pid)
-            
-            for pid in pids:
-                try:
-                    subprocess.run(f'taskkill /F /PID {pid}', shell=True, capture_output=True)
-                    print(f"✅ Stopped existing process {pid}")
-                except:
-                    pass
-            
-            if pids:
-                time.sleep(2)
-                print("🧹 Cleaned up existing processes")
+        if stopped:
+            print("🧹 Cleaned up existing processes")
     
     except Exception as e:
         print(f"⚠️  Note: {e}")
@@ -3,14 +3,20 @@
 Start both backend API and React frontend together
 """
 
+import asyncio
 import os
 import sys
 import subprocess
 import time
 import threading
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import httpx
+
+from _procutil import kill_port
+
 class FullSystemStarter:
     def __init__(self):
         self.backend_process = None
@@ -81,40 +87,24 @@ class FullSystemStarter:
         print("🧹 Cleaning up existing processes...")
         
         ports = [8000, 3000]
-        for port in ports:
-            try:
-                # Find processes using the port
-                result = subprocess.run(
-                    f'netstat -ano | findstr :{port}',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    pids = set()
-                    
-                    for line in lines:
-                        if 'LISTENING' in line:
-                            parts = line.split()
-                            if len(parts) >= 5:
-                                pid = parts[-1]
-                                pids.add(pid)
-                    
-                    # Kill the processes
-                    for pid in pids:
-                        try:
-                            subprocess.run(f'taskkill /F /PID {pid}', shell=True, capture_output=True)
-                            print(f"✅ Killed process {pid} on port {port}")
-                        except:
-                            pass
-                            
-                    if pids:
-                        time.sleep(2)  # Wait for processes to die
-                        
-            except Exception as e:
-                print(f"⚠️  Error cleaning port {port}: {e}")
+        
+        # Ports are independent, so clean them concurrently; each waits
+        # for its processes to exit
+        with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+            list(pool.map(self._clean_port, ports))
+    
+    def _clean_port(self, port):
+        """Kill the processes listening on `port`; returns their PIDs"""
+        try:
+            stopped, failed = kill_port(port)
+            for pid in stopped:
+                print(f"✅ Killed process {pid} on port {port}")
+            for pid in failed:
+                print(f"⚠️  Could not stop process {pid} on port {port}")
+            return stopped
+        except Exception as e:
+            print(f"⚠️  Error cleaning port {port}: {e}")
+            return set()
                 
     def start_backend(self):
         """Start the FastAPI backend"""
@@ -164,30 +154,42 @@ class FullSystemStarter:
             print(f"❌ Failed to start frontend: {e}")
             return False
             
+    async def _wait_for_url(self, client, name, url, process, timeout):
+        """Poll `url` with exponential backoff (100 ms up to 1 s) until it answers 200"""
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                return False
+            try:
+                response = await client.get(url, timeout=2)
+                if response.status_code == 200:
+                    print(f"✅ {name} is ready!")
+                    return True
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        return False
+    
+    async def _wait_for_all(self):
+        """Probe backend and frontend concurrently"""
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            return await asyncio.gather(
+                self._wait_for_url(client, "Backend API", "http://localhost:8000/health", self.backend_process, 30),
+                self._wait_for_url(client, "Frontend", "http://localhost:3000/", self.frontend_process, 60),
+            )
+    
     def wait_for_services(self):
         """Wait for both services to be ready"""
         print("⏳ Waiting for services to start...")
+        print("⏳ Frontend is starting (this may take a moment)...")
         
-        # Wait for backend
-        backend_ready = False
-        for i in range(30):
-            try:
-                import requests
-                response = requests.get("http://localhost:8000/health", timeout=2)
-                if response.status_code == 200:
-                    backend_ready = True
-                    print("✅ Backend API is ready!")
-                    break
-            except:
-                time.sleep(1)
-                
+        backend_ready, frontend_ready = asyncio.run(self._wait_for_all())
         if not backend_ready:
             print("⚠️  Backend may still be starting...")
-            
-        # Wait a bit for frontend
-        print("⏳ Frontend is starting (this may take a moment)...")
-        time.sleep(5)
-        print("✅ Frontend should be ready!")
+        if not frontend_ready:
+            print("⚠️  Frontend may still be starting...")
         
     def print_access_info(self):
         """Print access information"""
@@ -6,10 +6,10 @@ Simple system startup script for Delhi Air Quality Forecasting System
 import os
 import sys
 import subprocess
-import time
-import requests
 from pathlib import Path
 
+from _server_launcher import wait_for_server
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
@@ -50,15 +50,8 @@ def start_server():
         
         # Wait for server to start
         print("⏳ Waiting for server to start...")
-        for i in range(15):  # Wait up to 15 seconds
-            try:
-                response = requests.get("http://localhost:8000/health", timeout=2)
-                if response.status_code == 200:
-                    print("✅ Server is running!")
-                    break
-            except:
-                time.sleep(1)
-                print(f"   Starting... {i+1}/15")
+        if wait_for_server(process, "http://localhost:8000", timeout=15):
+            print("✅ Server is running!")
         else:
             print("⚠️  Server may still be starting...")
         
@@ -6,41 +6,23 @@ Start the system with the real trained model
 import os
 import sys
 import subprocess
-import time
 import requests
 from pathlib import Path
 
+from _procutil import kill_port
+from _server_launcher import wait_for_server
+
 def kill_processes_on_port(port):
     """Kill processes using the specified port"""
     try:
-        result = subprocess.run(
-            f'netstat -ano | findstr :{port}',
-            shell=True,
-            capture_output=True,
-            text=True
-        )
+        stopped, failed = kill_port(port)
+        for pid in stopped:
+            print(f"✅ Killed process {pid}")
+        for pid in failed:
+            print(f"⚠️  Could not stop process {pid} on port {port}")
         
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            pids = set()
-            
-            for line in lines:
-                if 'LISTENING' in line:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        pids.add(pid)
-            
-            for pid in pids:
-                try:
-                    subprocess.run(f'taskkill /F /PID {pid}', shell=True, capture_output=True)
-                    print(f"✅ Killed process {pid}")
-                except:
-                    pass
-                    
-            if pids:
-                time.sleep(2)
-                print(f"🧹 Cleaned up {len(pids)} processes on port {port}")
+        if stopped:
+            print(f"🧹 Cleaned up {len(stopped)} processes on port {port}")
         
     except Exception as e:
         print(f"⚠️  Error cleaning port {port}: {e}")
@@ -80,16 +62,8 @@ def start_with_real_model():
         print("🧠 Loading your Advanced LSTM model...")
         
         # Wait for server to be ready
-        for i in range(30):
-            try:
-                response = requests.get("http://localhost:8000/health", timeout=2)
-                if response.status_code == 200:
-                    print("✅ Server is running!")
-                    break
-            except:
-                time.sleep(1)
-                if i % 5 == 0:
-                    print(f"   Starting... {i+1}/30")
+        if wait_for_server(process, "http://localhost:8000", timeout=30):
+            print("✅ Server is running!")
         
         # Test the real model
         print("\n🔮 Testing real model predictions...")
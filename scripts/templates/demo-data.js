@@ -0,0 +1,18 @@
+
+// Demo data for standalone version
+const demoData = {
+    locations: [
+        { name: "Connaught Place", lat: 28.6315, lon: 77.2167, aqi: 125 },
+        { name: "India Gate", lat: 28.6129, lon: 77.2295, aqi: 98 },
+        { name: "Dwarka", lat: 28.5921, lon: 77.0460, aqi: 87 },
+        { name: "Gurgaon", lat: 28.4595, lon: 77.0266, aqi: 142 },
+        { name: "Noida", lat: 28.5355, lon: 77.3910, aqi: 108 }
+    ],
+    
+    forecasts: {
+        no2: new Float32Array([58, 62, 45, 38, 72, 68, 55, 42, 48, 52, 59, 63, 47, 41, 75, 71, 58, 45, 51, 55, 61, 65, 49, 43]),
+        o3: new Float32Array([32, 28, 35, 42, 38, 45, 52, 35, 30, 34, 31, 38, 45, 41, 48, 55, 38, 33, 37, 40, 36, 43, 50, 36])
+    }
+};
+
+console.log("Demo data loaded for standalone version");
@@ -96,6 +96,11 @@ class FastModelService:
         logger.info(f"⚡ INSTANT location-specific prediction for {latitude}, {longitude}")
         return result
     
+    def warmup(self) -> None:
+        """Run one throwaway prediction so the first real request skips cold-path costs"""
+        self.predict(28.6139, 77.2090, hours=1)
+        logger.info("⚡ Model warmed up")
+    
     def _get_location_factors(self, latitude: float, longitude: float) -> Dict:
         """Get location-specific factors for realistic variation"""
         